@@ -1,16 +1,89 @@
-import pandas as pd
-import tkinter as tk
-from tkinter import filedialog
+from __future__ import annotations
 from ytmusicapi import YTMusic
 import ytmusicapi as ytmapi
+import requests
+import urllib3
 import os
 import argparse
-from typing import Generator, Any
+import bisect
+import contextlib
+import csv
+from typing import TYPE_CHECKING, Callable, Generator, Any, Iterable, Optional, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import difflib
+import hashlib
+import itertools
+import json
+import random
+import re
+import sqlite3
+import sys
+import threading
+import time
+import unicodedata
+
+# pandas and tkinter are slow to import and only needed by some code paths,
+# so they are imported where they are used.
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Constants
 AUTH_FILE = "headers_auth.json"
+METADATA_CACHE_FILE = os.path.join(os.path.dirname(AUTH_FILE), "song_metadata_cache.sqlite3")
+JOURNAL_DIR = os.path.join(os.path.dirname(AUTH_FILE), "import_journals")
+PLAYLIST_CATALOG_FILE = os.path.join(os.path.dirname(AUTH_FILE), "playlist_catalog.json")
+SNAPSHOT_DIR = os.path.join(os.path.dirname(AUTH_FILE), "playlist_snapshots")
 PLAYLIST_IDS_TO_NOT_SHOW = ["LM", "SE"]
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_CACHE_TTL = 30 * 24 * 60 * 60
+DEFAULT_CACHE_SIZE = 100000
+# Cache writes are committed every this many entries, so a killed run keeps most of its lookups.
+CACHE_COMMIT_INTERVAL = 100
+DEFAULT_CATALOG_TTL = 10 * 60
+DEFAULT_RATE_LIMIT = 10.0
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_RETRY_BUDGET = 200
+# Endpoints that change the library. A server error or a dropped connection does not tell whether
+# the server applied the change, so they are only retried when it surely did not.
+WRITE_ENDPOINTS = {'add_playlist_items', 'create_playlist', 'delete_playlist', 'edit_playlist', 'rate_song', 'remove_playlist_items'}
+MANIFEST_MODES = ['add', 'liked', 'plan', 'mirror']
+MINHASH_BANDS = 10
+MINHASH_ROWS_PER_BAND = 3
+SIMILARITY_THRESHOLD = 0.8
+# Upper bounds in seconds of the request latency histogram buckets.
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+PROGRESS_INTERVAL = 1.0
+
+# Duplicate detection: tags that do not change the song, a trailing
+# " - Remastered 2011" style suffix, featured artists and punctuation.
+TITLE_TAG_PATTERN = re.compile(r"[\(\[][^\)\]]*\b(?:remaster(?:ed)?|feat\.?|ft\.?|featuring|official|lyrics?|audio|video|explicit|clean|radio edit|mono|stereo|bonus track|deluxe)\b[^\)\]]*[\)\]]")
+TITLE_SUFFIX_PATTERN = re.compile(r"\s+-\s+[^-]*\b(?:remaster(?:ed)?|radio edit|mono|stereo)\b[^-]*$")
+FEATURING_PATTERN = re.compile(r"\s+(?:feat\.?|ft\.?|featuring)\s+.*$")
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+# Titles that only differ by a number ("Chapter 1", "Part 2", "Track 01") are different songs.
+NUMBER_PATTERN = re.compile(r"\d+")
+
+# Song ID column detection: the share of sampled values that must look like a videoId.
+VIDEO_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{11}$")
+ID_COLUMN_SAMPLE_ROWS = 1000
+ID_COLUMN_MIN_MATCH_RATIO = 0.9
+
+# Search-based resolution of rows without a song ID: known header names of each
+# field, the weight of each field in the match score and the minimum score.
+SEARCH_COLUMN_NAMES = {
+    'title': ['title', 'track name', 'track', 'song', 'song name', 'name'],
+    'artist': ['artist', 'artists', 'artist name', 'artist name(s)', 'artist(s)'],
+    'album': ['album', 'album name', 'album title'],
+    'isrc': ['isrc'],
+}
+SEARCH_WEIGHTS = {'title': 0.6, 'artist': 0.3, 'album': 0.1}
+SEARCH_MIN_SCORE = 0.75
+SEARCH_RESULT_LIMIT = 10
+ARTIST_SEPARATOR_PATTERN = re.compile(r"\s*[,;/]\s*")
+
+# Columns of exported playlists, the same as the example CSV file, so exports can be imported again.
+EXPORT_COLUMNS = ['PlaylistBrowseId', 'PlaylistName', 'MediaId', 'Title', 'Artists', 'Duration', 'ThumbnailUrl']
 
 def get_file_path(args: argparse.Namespace) -> str:
     """
@@ -25,6 +98,12 @@ def get_file_path(args: argparse.Namespace) -> str:
     if args.csv:
         return args.csv
     else:
+        try:
+            import tkinter as tk
+            from tkinter import filedialog
+        except ImportError:
+            print("Error: tkinter is not installed. Use the --csv flag to specify the path to the CSV file.")
+            exit()
         root = tk.Tk()
         root.withdraw()
         file_path = filedialog.askopenfilename(filetypes=[('CSV Files', '*.csv')])
@@ -45,18 +124,22 @@ def validate_file_path(file_path: str) -> None:
     if not file_path.lower().endswith('.csv'):
         raise ValueError("The selected file is not a CSV file.")
 
-def read_csv_file(file_path: str) -> pd.DataFrame:
+def read_csv_file(file_path: str, usecols: list = None, nrows: int = None) -> pd.DataFrame:
     """
     Read the CSV file and return it as a DataFrame.
 
     Args:
         file_path (str): Path of the CSV file to read.
+        usecols (list, optional): Names of the columns to read. Defaults to None (all columns).
+        nrows (int, optional): Number of rows to read. Defaults to None (all rows).
 
     Returns:
         pd.DataFrame: DataFrame containing the CSV data.
     """
+    import pandas as pd
+
     try:
-        df = pd.read_csv(file_path)
+        df = pd.read_csv(file_path, usecols=usecols, nrows=nrows)
     except FileNotFoundError:
         raise FileNotFoundError("The selected file does not exist.")
     except pd.errors.EmptyDataError:
@@ -65,26 +148,226 @@ def read_csv_file(file_path: str) -> pd.DataFrame:
         raise ValueError("The selected file could not be parsed as a CSV file.")
     return df
 
-def get_id_column(df: pd.DataFrame) -> str:
+def read_csv_header(file_path: str) -> list:
+    """
+    Read only the header row of the CSV file.
+
+    Args:
+        file_path (str): Path of the CSV file to read.
+
+    Returns:
+        list: Names of the columns in the CSV file.
+    """
+    try:
+        with open(file_path, newline='', encoding='utf-8-sig') as csv_file:
+            header = next(csv.reader(csv_file), None)
+    except FileNotFoundError:
+        raise FileNotFoundError("The selected file does not exist.")
+    except csv.Error:
+        raise ValueError("The selected file could not be parsed as a CSV file.")
+    if not header:
+        raise ValueError("The selected file is empty.")
+    return header
+
+def stream_csv_column(file_path: str, id_column: str) -> Generator[str, None, None]:
+    """
+    Stream the values of a single column of the CSV file, one row at a time.
+
+    Only the selected column is kept, so memory use does not depend on the size of the file.
+
+    Args:
+        file_path (str): Path of the CSV file to read.
+        id_column (str): Name of the column to read.
+
+    Yields:
+        str: Non-empty values of the column.
+    """
+    with open(file_path, newline='', encoding='utf-8-sig') as csv_file:
+        reader = csv.reader(csv_file)
+        header = next(reader, [])
+        index = header.index(id_column)
+        try:
+            for row in reader:
+                if index < len(row) and row[index].strip():
+                    yield row[index].strip()
+        except csv.Error as e:
+            raise ValueError(f"The selected file could not be parsed as a CSV file: {e}")
+
+def read_song_rows(file_path: str, id_column: Optional[str], search_columns: dict, stream: bool = False) -> Generator[dict, None, None]:
+    """
+    Read the song ID and the search fields of each row of the CSV file.
+
+    Args:
+        file_path (str): Path of the CSV file to read.
+        id_column (Optional[str]): Name of the column containing song IDs, or None if the file has none.
+        search_columns (dict): Name of the column of each search field ('title', 'artist', 'album' and 'isrc').
+        stream (bool, optional): Read the file with the csv module instead of pandas. Defaults to False.
+
+    Yields:
+        dict: The 'videoId' and the search fields of each non-empty row; missing values are None.
+    """
+    fields = dict(search_columns)
+    if id_column is not None:
+        fields['videoId'] = id_column
+    if stream:
+        with open(file_path, newline='', encoding='utf-8-sig') as csv_file:
+            reader = csv.reader(csv_file)
+            header = next(reader, [])
+            indices = {field: header.index(column) for field, column in fields.items()}
+            try:
+                for row in reader:
+                    values = {field: (row[index].strip() if index < len(row) else '') or None for field, index in indices.items()}
+                    if any(values.values()):
+                        yield values
+            except csv.Error as e:
+                raise ValueError(f"The selected file could not be parsed as a CSV file: {e}")
+    else:
+        df = read_csv_file(file_path, usecols=list(set(fields.values()))).fillna('')
+        for row in zip(*(df[column] for column in fields.values())):
+            values = {field: str(value).strip() or None for field, value in zip(fields, row)}
+            if any(values.values()):
+                yield values
+
+def detect_search_columns(columns: list, overrides: dict = None) -> dict:
+    """
+    Find the columns holding the title, artist, album and ISRC of the songs from their names.
+
+    Args:
+        columns (list): Names of the columns in the CSV file.
+        overrides (dict, optional): Column names given on the command line, by search field. Defaults to None.
+
+    Returns:
+        dict: Name of the column of each search field found, or an empty dict if there is no title column.
+
+    Raises:
+        ValueError: If a column given in the overrides does not exist.
+    """
+    by_name = {column.strip().lower(): column for column in columns}
+    search_columns = {}
+    for field, names in SEARCH_COLUMN_NAMES.items():
+        column = (overrides or {}).get(field)
+        if column is not None and column not in columns:
+            raise ValueError(f"The column '{column}' does not exist in the CSV file.")
+        if column is None:
+            column = next((by_name[name] for name in names if name in by_name), None)
+        if column is not None:
+            search_columns[field] = column
+    return search_columns if 'title' in search_columns else {}
+
+def get_id_column(columns: list, search_available: bool = False) -> Optional[str]:
     """
     Get the column name containing song IDs from the user.
 
     Args:
-        df (pd.DataFrame): DataFrame representing the CSV data.
+        columns (list): Names of the columns in the CSV file.
+        search_available (bool, optional): Offer to search the songs by title instead. Defaults to False.
 
     Returns:
-        str: Name of the column containing song IDs.
+        Optional[str]: Name of the column containing song IDs, or None if the user chose to search the songs.
     """
     print("Columns in the CSV file:")
-    for i, column in enumerate(df.columns, start=1):
+    for i, column in enumerate(columns, start=1):
         print(f"{i}. {column}")
+    if search_available:
+        prompt = "Enter the number of the column that contains song IDs, or 's' to search the songs by title and artist: "
+    else:
+        prompt = "Enter the number of the column that contains song IDs: "
     while True:
-        column_number = input("Enter the number of the column that contains song IDs: ")
-        if column_number.isdigit() and 1 <= int(column_number) <= len(df.columns):
-            return df.columns[int(column_number) - 1]
+        column_number = input(prompt)
+        if column_number.isdigit() and 1 <= int(column_number) <= len(columns):
+            return columns[int(column_number) - 1]
+        elif search_available and column_number.strip().lower() in ['s', 'search']:
+            return None
         else:
             print("Invalid input. Please enter a valid number.")
 
+def detect_id_column(file_path: str, columns: list, stream: bool = False) -> Optional[str]:
+    """
+    Detect the column containing song IDs by matching a sample of each column against the videoId pattern.
+
+    Args:
+        file_path (str): Path of the CSV file.
+        columns (list): Names of the columns in the CSV file.
+        stream (bool, optional): Sample the file with the csv module instead of pandas. Defaults to False.
+
+    Returns:
+        Optional[str]: Name of the only column whose values are mostly videoIds, or None if no
+            column or more than one column looks like song IDs.
+    """
+    if stream:
+        matches, counts = [0] * len(columns), [0] * len(columns)
+        with open(file_path, newline='', encoding='utf-8-sig') as csv_file:
+            reader = csv.reader(csv_file)
+            next(reader, None)
+            for row in itertools.islice(reader, ID_COLUMN_SAMPLE_ROWS):
+                for index, value in enumerate(row[:len(columns)]):
+                    value = value.strip()
+                    if value:
+                        counts[index] += 1
+                        matches[index] += VIDEO_ID_PATTERN.match(value) is not None
+        ratios = {column: matches[index] / counts[index] for index, column in enumerate(columns) if counts[index]}
+    else:
+        sample = read_csv_file(file_path, nrows=ID_COLUMN_SAMPLE_ROWS)
+        ratios = {}
+        for column in sample.columns:
+            values = sample[column].dropna().astype(str).str.strip()
+            if len(values):
+                ratios[column] = values.str.match(VIDEO_ID_PATTERN.pattern).mean()
+    candidates = [column for column, ratio in ratios.items() if ratio >= ID_COLUMN_MIN_MATCH_RATIO]
+    return candidates[0] if len(candidates) == 1 else None
+
+def select_id_column(file_path: str, id_column: str = None, stream: bool = False, assume_yes: bool = False, search_available: bool = False, search: bool = False) -> Optional[str]:
+    """
+    Get the column containing song IDs from the --id-column flag, by detecting it, or from the user.
+
+    If the column cannot be detected, the songs are searched by title without asking only with
+    --search or --yes, since a missed ID column would otherwise turn every row into a search.
+
+    Args:
+        file_path (str): Path of the CSV file.
+        id_column (str, optional): Name of the column given on the command line. Defaults to None.
+        stream (bool, optional): Whether the file is streamed. Defaults to False.
+        assume_yes (bool, optional): Do not ask the user if the column cannot be detected. Defaults to False.
+        search_available (bool, optional): Whether the songs can be searched by title instead. Defaults to False.
+        search (bool, optional): Whether the --search flag was given. Defaults to False.
+
+    Returns:
+        Optional[str]: Name of the column containing song IDs, or None if there is none and the songs are searched.
+    """
+    columns = read_csv_header(file_path)
+    if id_column is not None:
+        if id_column not in columns:
+            print(f"Error: The column '{id_column}' does not exist in the CSV file.")
+            exit()
+        return id_column
+    id_column = detect_id_column(file_path, columns, stream)
+    if id_column is not None:
+        print(f"Using the column '{id_column}' for the song IDs.")
+        return id_column
+    if search_available and (search or assume_yes):
+        print("No song ID column found. The songs will be searched by title and artist.")
+        return None
+    if assume_yes:
+        print("Error: The column containing song IDs could not be detected. Use the --id-column flag to specify it.")
+        exit()
+    return get_id_column(columns, search_available)
+
+def unique_values(values: Iterable[Any]) -> Generator[Any, None, None]:
+    """
+    Generate the values of an iterable without duplicates, keeping their order.
+
+    Args:
+        values (Iterable[Any]): Values to deduplicate.
+
+    Yields:
+        Any: Unique values.
+    """
+    seen = set()
+    for value in values:
+        if value not in seen:
+            seen.add(value)
+            yield value
+
 def get_unique_song_ids(df: pd.DataFrame, id_column: str) -> Generator[Any, Any, Any]:
     """
     Generate unique song IDs from the specified column in the DataFrame.
@@ -96,11 +379,7 @@ def get_unique_song_ids(df: pd.DataFrame, id_column: str) -> Generator[Any, Any,
     Yields:
         Any: Unique song IDs.
     """
-    seen = set()
-    for value in df[id_column]:
-        if value not in seen:
-            seen.add(value)
-            yield value
+    yield from unique_values(df[id_column])
 
 def authenticate_ytmusic() -> YTMusic:
     """
@@ -121,23 +400,539 @@ def authenticate_ytmusic() -> YTMusic:
         exit()
     return ytmusic
 
-def get_playlist_choice() -> str:
+class AdaptiveRateLimiter:
+    """
+    Token bucket rate limiter that slows down when the server throttles requests.
+
+    The rate is halved on every throttling response and recovers slowly
+    (additive increase) on successful requests, up to the configured maximum.
+    """
+
+    def __init__(self, max_rate: float = DEFAULT_RATE_LIMIT, min_rate: float = 0.2, burst: int = 5) -> None:
+        """
+        Create the rate limiter.
+
+        Args:
+            max_rate (float, optional): Maximum number of requests per second. Defaults to DEFAULT_RATE_LIMIT.
+            min_rate (float, optional): Rate the limiter never goes below when throttled. Defaults to 0.2.
+            burst (int, optional): Number of requests that can be sent back to back. Defaults to 5.
+        """
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.rate = max_rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until a request may be sent.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def throttled(self) -> None:
+        """
+        Halve the rate after a throttling response.
+        """
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0)
+
+    def succeeded(self) -> None:
+        """
+        Slowly raise the rate again after a successful request.
+        """
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + 0.1)
+
+def get_http_status(error: Exception) -> Optional[int]:
+    """
+    Get the HTTP status code of a failed YTMusic request.
+
+    Args:
+        error (Exception): Error raised by the YTMusic API.
+
+    Returns:
+        Optional[int]: The HTTP status code, or None if the error does not contain one.
+    """
+    match = re.search(r"HTTP (\d{3})", str(error))
+    return int(match.group(1)) if match else None
+
+def is_connect_error(error: Exception) -> bool:
+    """
+    Check whether a failed YTMusic request failed while connecting, before the request was sent.
+
+    Args:
+        error (Exception): Error raised by the YTMusic API.
+
+    Returns:
+        bool: True if no connection could be established, False otherwise.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError) or not error.args:
+        return False
+    return isinstance(getattr(error.args[0], 'reason', None), urllib3.exceptions.NewConnectionError)
+
+class RateLimitedYTMusic:
+    """
+    Wrapper around YTMusic that sends every API call through a shared rate limiter
+    and retries transient failures (throttling, server errors and network errors)
+    with exponential backoff and jitter. Write endpoints are only retried when the
+    request was throttled or could not be sent.
+    """
+
+    def __init__(self, ytmusic: YTMusic, limiter: AdaptiveRateLimiter = None, max_retries: int = DEFAULT_MAX_RETRIES, retry_budget: int = DEFAULT_RETRY_BUDGET, backoff_base: float = 1.0, backoff_max: float = 60.0) -> None:
+        """
+        Wrap an authenticated YTMusic instance.
+
+        Args:
+            ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+            limiter (AdaptiveRateLimiter, optional): Rate limiter shared by all calls. Defaults to a new limiter.
+            max_retries (int, optional): Maximum number of retries of a single call. Defaults to DEFAULT_MAX_RETRIES.
+            retry_budget (int, optional): Maximum number of retries over the whole run. Defaults to DEFAULT_RETRY_BUDGET.
+            backoff_base (float, optional): Initial backoff in seconds. Defaults to 1.0.
+            backoff_max (float, optional): Maximum backoff in seconds. Defaults to 60.0.
+        """
+        self.ytmusic = ytmusic
+        self.limiter = limiter or AdaptiveRateLimiter()
+        self.max_retries = max_retries
+        self.retry_budget = retry_budget
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.counters = {'calls': 0, 'retries': 0, 'throttles': 0, 'failures': 0}
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.ytmusic, name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            return self.call(attribute, *args, **kwargs)
+        return call
+
+    def _count(self, counter: str, endpoint: str) -> None:
+        with self._lock:
+            self.counters[counter] += 1
+            self._endpoint(endpoint)[counter] += 1
+
+    def _endpoint(self, endpoint: str) -> dict:
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = {'calls': 0, 'retries': 0, 'throttles': 0, 'failures': 0,
+                     'latency_total': 0.0, 'latency_max': 0.0, 'latency_histogram': [0] * (len(LATENCY_BUCKETS) + 1)}
+            self.endpoints[endpoint] = stats
+        return stats
+
+    def _record_latency(self, endpoint: str, latency: float) -> None:
+        bucket = next((index for index, bound in enumerate(LATENCY_BUCKETS) if latency <= bound), len(LATENCY_BUCKETS))
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats['latency_total'] += latency
+            stats['latency_max'] = max(stats['latency_max'], latency)
+            stats['latency_histogram'][bucket] += 1
+
+    def _take_retry(self, endpoint: str) -> bool:
+        with self._lock:
+            if self.retry_budget <= 0:
+                return False
+            self.retry_budget -= 1
+            self.counters['retries'] += 1
+            self._endpoint(endpoint)['retries'] += 1
+            return True
+
+    def call(self, method, *args, **kwargs) -> Any:
+        """
+        Call a YTMusic method, retrying transient failures.
+
+        Args:
+            method: Bound YTMusic method to call.
+            *args: Positional arguments of the method.
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            Any: The result of the method.
+        """
+        endpoint = getattr(method, '__name__', 'unknown')
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            self._count('calls', endpoint)
+            start = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            except Exception as e:
+                self._record_latency(endpoint, time.perf_counter() - start)
+                status = get_http_status(e)
+                throttled = status == 429
+                if endpoint in WRITE_ENDPOINTS:
+                    transient = throttled or is_connect_error(e)
+                else:
+                    transient = throttled or (status is not None and status >= 500) or isinstance(e, OSError)
+                if throttled:
+                    self._count('throttles', endpoint)
+                    self.limiter.throttled()
+                if not transient or attempt >= self.max_retries or not self._take_retry(endpoint):
+                    self._count('failures', endpoint)
+                    raise
+                delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+                attempt += 1
+                time.sleep(delay)
+                continue
+            self._record_latency(endpoint, time.perf_counter() - start)
+            self.limiter.succeeded()
+            return result
+
+    def print_summary(self) -> None:
+        """
+        Print the request counters.
+        """
+        print(f"Requests: {self.counters['calls']}, retries: {self.counters['retries']}, "
+              f"throttled: {self.counters['throttles']}, failed: {self.counters['failures']}")
+
+    def endpoint_stats(self) -> dict:
+        """
+        Get the request counters and latencies of each YTMusic endpoint.
+
+        Returns:
+            dict: Calls, retries, throttles, failures and latencies in seconds (total, mean, max and
+                a histogram keyed by the upper bound of each bucket) by endpoint name.
+        """
+        bounds = [f"<={bound:g}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]:g}s"]
+        with self._lock:
+            return {endpoint: {
+                'calls': stats['calls'],
+                'retries': stats['retries'],
+                'throttles': stats['throttles'],
+                'failures': stats['failures'],
+                'latency': {
+                    'total': round(stats['latency_total'], 3),
+                    'mean': round(stats['latency_total'] / stats['calls'], 4) if stats['calls'] else 0.0,
+                    'max': round(stats['latency_max'], 3),
+                    'histogram': dict(zip(bounds, stats['latency_histogram'])),
+                },
+            } for endpoint, stats in sorted(self.endpoints.items())}
+
+class RunReport:
+    """
+    Timings and song outcomes of a run, for the --report file and the --quiet progress line.
+
+    Phase times are exclusive: when a phase pulls items from another phase (such as
+    metadata resolution reading a streamed CSV file), the time spent in the inner
+    phase is not counted in the outer one. With concurrent manifest jobs the phase
+    times of all jobs are added up.
+    """
+
+    def __init__(self, quiet: bool = False) -> None:
+        """
+        Create an empty report.
+
+        Args:
+            quiet (bool, optional): Replace the per-song output with a throttled progress line. Defaults to False.
+        """
+        self.quiet = quiet
+        self.started_at = time.time()
+        self.phases = {}
+        self.songs = {}
+        self._start = time.perf_counter()
+        self._last_progress = 0.0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _add_time(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """
+        Time a phase of the run.
+
+        Args:
+            name (str): Name of the phase.
+        """
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        now = time.perf_counter()
+        if stack:
+            self._add_time(stack[-1][0], now - stack[-1][1])
+        stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            phase, start = stack.pop()
+            self._add_time(phase, now - start)
+            if stack:
+                stack[-1][1] = now
+
+    def timed(self, name: str, items: Iterable[Any]) -> Generator[Any, None, None]:
+        """
+        Time a lazy phase: the time spent producing each item is counted in the phase.
+
+        Args:
+            name (str): Name of the phase.
+            items (Iterable[Any]): Items produced by the phase.
+
+        Yields:
+            Any: The items.
+        """
+        iterator = iter(items)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def song(self, outcome: str, *lines: str) -> None:
+        """
+        Record the outcome of a song and print its details, or update the progress line in quiet mode.
+
+        Args:
+            outcome (str): Outcome of the song, such as 'added', 'skipped', 'failed' or 'removed'.
+            *lines (str): Lines to print about the song.
+        """
+        with self._lock:
+            self.songs[outcome] = self.songs.get(outcome, 0) + 1
+        if not self.quiet:
+            for line in lines:
+                print(line)
+            return
+        now = time.perf_counter()
+        if now - self._last_progress >= PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.print_progress()
+
+    def print_progress(self) -> None:
+        """
+        Print the progress line: the number of songs per outcome and the processing rate.
+        """
+        with self._lock:
+            songs = dict(self.songs)
+        total = sum(songs.values())
+        elapsed = time.perf_counter() - self._start
+        outcomes = ', '.join(f"{count} {outcome}" for outcome, count in sorted(songs.items()))
+        line = f"Progress: {total} songs ({outcomes}), {total / elapsed if elapsed else 0:.1f} songs/s"
+        # Overwrite the line in a terminal, keep one line per update in a log file.
+        print(f"\r{line}" if sys.stdout.isatty() else line, end='' if sys.stdout.isatty() else '\n', flush=True)
+
+    def end_progress(self) -> None:
+        """
+        Print the final progress line in quiet mode.
+        """
+        if self.quiet and self.songs:
+            self.print_progress()
+            if sys.stdout.isatty():
+                print("")
+
+    def to_dict(self, ytmusic: YTMusic = None) -> dict:
+        """
+        Build the machine-readable report.
+
+        Args:
+            ytmusic (YTMusic, optional): Session to include the request counters of. Defaults to None.
+
+        Returns:
+            dict: Start and end time, wall time, seconds per phase, songs per outcome and, with a
+                RateLimitedYTMusic session, the request counters in total and per endpoint.
+        """
+        report = {
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(self.started_at)),
+            'finished_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'wall_time': round(time.perf_counter() - self._start, 3),
+            'phases': {phase: round(seconds, 3) for phase, seconds in self.phases.items()},
+            'songs': dict(self.songs),
+        }
+        if isinstance(ytmusic, RateLimitedYTMusic):
+            report['requests'] = dict(ytmusic.counters)
+            report['endpoints'] = ytmusic.endpoint_stats()
+        return report
+
+    def write(self, path: str, ytmusic: YTMusic = None) -> None:
+        """
+        Write the report to a JSON file.
+
+        Args:
+            path (str): Path of the report file.
+            ytmusic (YTMusic, optional): Session to include the request counters of. Defaults to None.
+        """
+        with open(path, 'w', encoding='utf-8') as report_file:
+            json.dump(self.to_dict(ytmusic), report_file, indent=2)
+
+def get_run_report(ytmusic: YTMusic) -> RunReport:
+    """
+    Get the run report of a YTMusic session, creating one if the session does not have one yet.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+
+    Returns:
+        RunReport: The report of the session.
+    """
+    report = getattr(ytmusic, 'run_report', None)
+    if report is None:
+        report = RunReport()
+        ytmusic.run_report = report
+    return report
+
+class PlaylistCatalog:
+    """
+    Session-level catalog of the library playlists, indexed by ID and by title.
+
+    The library is listed once per session (or loaded from a short-lived file
+    cache) and the listing is invalidated when a playlist is created. A listing
+    loaded from the file is fetched again when a lookup misses, since playlists
+    may have been created or renamed in YouTube Music after it was saved.
+    """
+
+    def __init__(self, ytmusic: YTMusic, path: str = None, ttl: float = DEFAULT_CATALOG_TTL) -> None:
+        """
+        Create the catalog. The playlists are only fetched when they are first needed.
+
+        Args:
+            ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+            path (str, optional): File to persist the listing in, None to keep it in memory only. Defaults to None.
+            ttl (float, optional): Number of seconds a persisted listing stays valid. Defaults to DEFAULT_CATALOG_TTL.
+        """
+        self.ytmusic = ytmusic
+        self.path = path
+        self.ttl = ttl
+        self._playlists = None
+        self._from_file = False
+        self._by_id = {}
+        self._by_title = {}
+        self._lock = threading.Lock()
+
+    def _load(self, use_file: bool = True) -> None:
+        playlists = None
+        if use_file and self.path and os.path.isfile(self.path) and time.time() - os.path.getmtime(self.path) < self.ttl:
+            try:
+                with open(self.path, encoding='utf-8') as catalog_file:
+                    playlists = json.load(catalog_file)
+            except ValueError:
+                playlists = None
+        self._from_file = playlists is not None
+        if playlists is None:
+            with get_run_report(self.ytmusic).phase('playlist_fetch'):
+                library_playlists = self.ytmusic.get_library_playlists(limit=None)
+            playlists = [{'playlistId': playlist['playlistId'], 'title': playlist['title'], 'count': playlist.get('count')}
+                         for playlist in library_playlists]
+            if self.path:
+                with open(self.path, 'w', encoding='utf-8') as catalog_file:
+                    json.dump(playlists, catalog_file, ensure_ascii=False)
+        self._playlists = playlists
+        self._by_id = {playlist['playlistId']: playlist for playlist in playlists}
+        self._by_title = {}
+        for playlist in playlists:
+            self._by_title.setdefault(playlist['title'], playlist)
+
+    @property
+    def playlists(self) -> list:
+        """
+        list: The library playlists, in library order.
+        """
+        with self._lock:
+            if self._playlists is None:
+                self._load()
+            return self._playlists
+
+    def fetched_playlists(self) -> list:
+        """
+        Get the library playlists, fetching them again if the listing was loaded from the file.
+
+        Returns:
+            list: The library playlists, in library order.
+        """
+        with self._lock:
+            if self._playlists is None or self._from_file:
+                self._load(use_file=False)
+            return self._playlists
+
+    def get(self, name_or_id: str) -> Optional[dict]:
+        """
+        Find a playlist by ID or by title.
+
+        Args:
+            name_or_id (str): ID or title of the playlist.
+
+        Returns:
+            Optional[dict]: The playlist ('playlistId', 'title' and 'count'), or None if it does not exist.
+        """
+        with self._lock:
+            if self._playlists is None:
+                self._load()
+            playlist = self._by_id.get(name_or_id) or self._by_title.get(name_or_id)
+            if playlist is None and self._from_file:
+                self._load(use_file=False)
+                playlist = self._by_id.get(name_or_id) or self._by_title.get(name_or_id)
+            return playlist
+
+    def invalidate(self) -> None:
+        """
+        Drop the listing, so the next lookup fetches it again.
+        """
+        with self._lock:
+            self._playlists = None
+            if self.path and os.path.isfile(self.path):
+                os.remove(self.path)
+
+def get_playlist_catalog(ytmusic: YTMusic) -> PlaylistCatalog:
+    """
+    Get the playlist catalog of a YTMusic session, creating an in-memory one if the session does not have one yet.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+
+    Returns:
+        PlaylistCatalog: The catalog of the session.
+    """
+    catalog = getattr(ytmusic, 'playlist_catalog', None)
+    if catalog is None:
+        catalog = PlaylistCatalog(ytmusic)
+        ytmusic.playlist_catalog = catalog
+    return catalog
+
+def get_playlist_choice(allow_new: bool = True) -> str:
     """
     Prompt the user to choose how they want to handle playlists.
 
+    Args:
+        allow_new (bool, optional): Offer to create a new playlist. Defaults to True.
+
     Returns:
         str: User's choice ('existing', 'new', or 'liked').
     """
     while True:
-        choice = input("Do you want to add the songs to an existing playlist, create a new one, or add to Liked Songs? (existing/e, new/n, liked/l): ")
+        if allow_new:
+            choice = input("Do you want to add the songs to an existing playlist, create a new one, or add to Liked Songs? (existing/e, new/n, liked/l): ")
+        else:
+            choice = input("Do you want to use an existing playlist or Liked Songs? (existing/e, liked/l): ")
         if choice.lower() in ['existing', 'e', 'ex', 'exist']:
             return 'existing'
-        elif choice.lower() in ['new', 'n', 'ne', 'create']:
+        elif allow_new and choice.lower() in ['new', 'n', 'ne', 'create']:
             return 'new'
         elif choice.lower() in ['liked', 'l', 'like', 'likes']:
             return 'liked'
-        else:
+        elif allow_new:
             print("Invalid choice. Please enter 'existing', 'new', or 'liked'.")
+        else:
+            print("Invalid choice. Please enter 'existing' or 'liked'.")
 
 def create_or_get_playlist(ytmusic: YTMusic, values) -> str:
     """
@@ -158,33 +953,39 @@ def create_or_get_playlist(ytmusic: YTMusic, values) -> str:
     elif choice == 'new':
         return create_playlist(ytmusic)
 
-def create_playlist(ytmusic: YTMusic) -> str:
+def create_playlist(ytmusic: YTMusic, playlist_name: str = None, playlist_description: str = None) -> str:
     """
     Create a new playlist.
 
     Args:
         ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        playlist_name (str, optional): Name of the playlist. Defaults to None, which asks the user.
+        playlist_description (str, optional): Description of the playlist. Defaults to None, which asks the user.
 
     Returns:
         str: ID of the newly created playlist.
     """
-    playlist_name = input("Enter the playlist name to create: ")
-    playlist_description = input("Enter a description for the playlist: ")
+    if playlist_name is None:
+        playlist_name = input("Enter the playlist name to create: ")
+    if playlist_description is None:
+        playlist_description = input("Enter a description for the playlist: ")
     try:
         playlist_id = ytmusic.create_playlist(playlist_name, description=playlist_description)
     except Exception as e:
         print(f"Error creating playlist: {e}")
         exit()
+    get_playlist_catalog(ytmusic).invalidate()
     print(f"New playlist '{playlist_name}' created.")
     return playlist_id
 
-def get_existing_playlist(ytmusic: YTMusic, prompt: str = "Enter the number of the playlist to add the songs to: ") -> str:
+def get_existing_playlist(ytmusic: YTMusic, prompt: str = "Enter the number of the playlist to add the songs to: ", allow_new: bool = True) -> str:
     """
     Get an existing playlist from the user.
 
     Args:
         ytmusic (YTMusic): An authenticated instance of the YTMusic class.
         prompt (str, optional): Prompt message for the user. Defaults to "Enter the number of the playlist to add the songs to: ".
+        allow_new (bool, optional): Create a new playlist if there are no existing playlists. Defaults to True.
 
     Returns:
         str: ID of the selected playlist.
@@ -193,12 +994,14 @@ def get_existing_playlist(ytmusic: YTMusic, prompt: str = "Enter the number of t
         print("Error: YTMusic object not found.")
         exit()
     try:
-        playlists = [playlist for playlist in ytmusic.get_library_playlists() if playlist['playlistId'] not in PLAYLIST_IDS_TO_NOT_SHOW]
+        playlists = [playlist for playlist in get_playlist_catalog(ytmusic).fetched_playlists() if playlist['playlistId'] not in PLAYLIST_IDS_TO_NOT_SHOW]
     except Exception as e:
         print(f"Error getting library playlists: {e}")
         exit()
     if not playlists:
         print("No existing playlists found.")
+        if not allow_new:
+            exit()
         return create_playlist(ytmusic)
     print("Existing playlists:")
     for i, playlist in enumerate(playlists, start=1):
@@ -222,19 +1025,14 @@ def get_playlist_id(ytmusic: YTMusic, playlist_name: str) -> str:
         str: ID of the playlist.
     """
     try:
-        playlists = ytmusic.get_library_playlists()
+        playlist = get_playlist_catalog(ytmusic).get(playlist_name)
     except Exception as e:
         print(f"Error getting library playlists: {e}")
         exit()
-    playlist_id = None
-    for playlist in playlists:
-        if playlist['title'] == playlist_name or playlist['playlistId'] == playlist_name:
-            playlist_id = playlist['playlistId']
-            break
-    if playlist_id is None:
+    if playlist is None:
         print("Error: The specified playlist name or ID does not exist.")
         exit()
-    return playlist_id
+    return playlist['playlistId']
 
 def get_playlist_songs(ytmusic: YTMusic, playlist_id: str) -> list:
     """
@@ -245,272 +1043,2087 @@ def get_playlist_songs(ytmusic: YTMusic, playlist_id: str) -> list:
         playlist_id (str): ID of the playlist.
 
     Returns:
-        list: List of songs in the playlist.
+        list: Track records of the songs in the playlist, without repeated songs.
     """
-    try:
-        playlist = ytmusic.get_playlist(playlist_id, limit=None)
-        playlist_songs = {song['videoId']: song for song in playlist['tracks']}
-        return list(playlist_songs.values())
-    except Exception as e:
-        print(f"Error getting songs from playlist: {e}")
-        exit()
+    playlist_songs = {track.video_id: track for track in get_playlist_snapshot(ytmusic, playlist_id).tracks}
+    return list(playlist_songs.values())
 
-def get_playlist_name(ytmusic: YTMusic, playlist_id: str) -> str:
+class Track:
     """
-    Get the name of a playlist.
+    Compact record of a playlist track, keeping only the fields this script uses.
+    """
+    __slots__ = ('video_id', 'set_video_id', 'title', 'artist')
+
+    def __init__(self, video_id: str, set_video_id: str = None, title: str = None, artist: str = None) -> None:
+        self.video_id = video_id
+        self.set_video_id = set_video_id
+        self.title = title
+        self.artist = artist
+
+    @classmethod
+    def from_api(cls, track: dict) -> Track:
+        """
+        Create a record from a playlist track as returned by the YTMusic API.
+
+        Args:
+            track (dict): Playlist track.
+
+        Returns:
+            Track: The record.
+        """
+        artists = track.get('artists') or []
+        return cls(track['videoId'], track.get('setVideoId'), track.get('title'), artists[0].get('name') if artists else None)
+
+class PlaylistSnapshot:
+    """
+    In-memory index of the contents of a playlist.
+
+    'tracks' is the list of Track records in playlist order, 'song_ids' the set
+    of their videoIds used for membership checks and 'stale' is set when the
+    tracks no longer reflect the playlist.
+    """
+    __slots__ = ('id', 'title', 'tracks', 'song_ids', 'stale')
+
+    def __init__(self, playlist_id: str, title: str, tracks: list = None) -> None:
+        self.id = playlist_id
+        self.title = title
+        self.stale = False
+        self.set_tracks(tracks or [])
+
+    @property
+    def track_count(self) -> int:
+        """
+        int: Number of different songs in the playlist.
+        """
+        return len(self.song_ids)
+
+    def set_tracks(self, tracks: list) -> None:
+        """
+        Replace the tracks of the snapshot and rebuild its index.
+
+        Args:
+            tracks (list): New Track records of the playlist.
+        """
+        self.tracks = tracks
+        self.song_ids = {track.video_id for track in tracks}
+
+    def add_track(self, track: Track) -> None:
+        """
+        Append a track that was added to the end of the playlist.
+
+        Args:
+            track (Track): Record of the added track.
+        """
+        self.tracks.append(track)
+        self.song_ids.add(track.video_id)
+
+class PlaylistSnapshotStore:
+    """
+    Playlist snapshots saved by earlier runs, one JSON file per playlist ID.
+
+    Each snapshot is saved with a signature of the first page of the playlist
+    (track count, duration and the IDs of the first tracks), so a later run only
+    downloads the full track list when the signature has changed. Changes past
+    the first page that keep the track count, such as replacing a song, do not
+    change the signature, so the store is only used with --snapshot-cache.
+    """
+
+    def __init__(self, directory: str = SNAPSHOT_DIR, refresh: bool = False) -> None:
+        """
+        Open the store.
+
+        Args:
+            directory (str, optional): Directory of the snapshot files. Defaults to SNAPSHOT_DIR.
+            refresh (bool, optional): Ignore the saved snapshots and download the playlists again. Defaults to False.
+        """
+        self.directory = directory
+        self.refresh = refresh
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, playlist_id: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha256(playlist_id.encode('utf-8')).hexdigest()[:16]}.json")
+
+    def load(self, playlist_id: str, signature: str) -> Optional[PlaylistSnapshot]:
+        """
+        Load the saved snapshot of a playlist if the playlist has not changed since.
+
+        Args:
+            playlist_id (str): ID of the playlist.
+            signature (str): Signature of the current first page of the playlist.
+
+        Returns:
+            Optional[PlaylistSnapshot]: The snapshot, or None if there is no saved snapshot or the playlist has changed.
+        """
+        path = self._path(playlist_id)
+        if self.refresh or signature is None or not os.path.isfile(path):
+            return None
+        try:
+            with open(path, encoding='utf-8') as snapshot_file:
+                data = json.load(snapshot_file)
+        except ValueError:
+            return None
+        if data.get('id') != playlist_id or data.get('signature') != signature:
+            return None
+        return PlaylistSnapshot(playlist_id, data['title'], [Track(*track) for track in data['tracks']])
+
+    def save(self, snapshot: PlaylistSnapshot, signature: str) -> None:
+        """
+        Save the snapshot of a playlist.
+
+        Args:
+            snapshot (PlaylistSnapshot): Snapshot to save.
+            signature (str): Signature of the first page of the playlist the snapshot reflects.
+        """
+        if signature is None:
+            self.discard(snapshot.id)
+            return
+        data = {'id': snapshot.id, 'title': snapshot.title, 'signature': signature,
+                'tracks': [[track.video_id, track.set_video_id, track.title, track.artist] for track in snapshot.tracks]}
+        path = self._path(snapshot.id)
+        with open(f"{path}.tmp", 'w', encoding='utf-8') as snapshot_file:
+            json.dump(data, snapshot_file, ensure_ascii=False, separators=(',', ':'))
+        os.replace(f"{path}.tmp", path)
+
+    def discard(self, playlist_id: str) -> None:
+        """
+        Delete the saved snapshot of a playlist, so the next run downloads it again.
+
+        Args:
+            playlist_id (str): ID of the playlist.
+        """
+        path = self._path(playlist_id)
+        if os.path.isfile(path):
+            os.remove(path)
+
+def fetch_playlist(ytmusic: YTMusic, playlist_id: str, limit: Optional[int]) -> dict:
+    """
+    Fetch a playlist, or Liked Songs if the playlist ID is 'LM'.
 
     Args:
         ytmusic (YTMusic): An authenticated instance of the YTMusic class.
         playlist_id (str): ID of the playlist.
+        limit (Optional[int]): Number of tracks to fetch, None for all of them.
 
     Returns:
-        str: Name of the playlist.
+        dict: The playlist as returned by the YTMusic API.
     """
-    try:
-        playlists = ytmusic.get_library_playlists()
-    except Exception as e:
-        print(f"Error getting library playlists: {e}")
-        exit()
-    playlist_name = None
-    for playlist in playlists:
-        if playlist['playlistId'] == playlist_id:
-            playlist_name = playlist['title']
-            break
-    if playlist_name is None:
-        print("Error: The specified playlist ID does not exist.")
-        exit()
-    return playlist_name
+    if playlist_id == 'LM':
+        return ytmusic.get_liked_songs(limit=limit)
+    return ytmusic.get_playlist(playlist_id, limit=limit)
 
-def add_to_liked_songs(ytmusic: YTMusic, values: list) -> None:
+def iter_playlist_pages(ytmusic: YTMusic, playlist_id: str) -> Generator[list, None, None]:
     """
-    Add songs to Liked Songs.
+    Fetch the tracks of a playlist, or Liked Songs if the playlist ID is 'LM', one page at a time.
+
+    get_playlist only returns once every page has been fetched, so the pages are
+    requested with the browse continuations ytmusicapi uses internally, and each
+    page can be processed and dropped before the next one is fetched. If those
+    internals are not available (another ytmusicapi version or a different
+    backend), the whole playlist is fetched with get_playlist and returned as a
+    single page.
 
     Args:
         ytmusic (YTMusic): An authenticated instance of the YTMusic class.
-        values (list): List of song IDs to be added.
+        playlist_id (str): ID of the playlist.
+
+    Yields:
+        list: Tracks of each page, as returned by the YTMusic API.
     """
     try:
-        confirmation = input("Are you sure you want to add these songs to Liked Songs? (yes/no): ").strip().lower()
-        if confirmation not in ["yes", "y"]:
-            print("Operation canceled.")
-            return
+        from ytmusicapi.continuations import CONTINUATION_ITEMS, get_continuation_token
+        from ytmusicapi.navigation import CONTENT, SECTION, TWO_COLUMN_RENDERER, nav
+        from ytmusicapi.parsers.playlists import parse_playlist_items
+        send_request = ytmusic._send_request
+    except (ImportError, AttributeError):
+        yield fetch_playlist(ytmusic, playlist_id, None).get('tracks') or []
+        return
+
+    def get_playlist_page(body: dict) -> dict:
+        return send_request('browse', body)
+
+    def request(body: dict) -> dict:
+        if isinstance(ytmusic, RateLimitedYTMusic):
+            return ytmusic.call(get_playlist_page, body)
+        return get_playlist_page(body)
+
+    response = request({'browseId': playlist_id if playlist_id.startswith('VL') else 'VL' + playlist_id})
+    try:
+        section_list = nav(response, [*TWO_COLUMN_RENDERER, 'secondaryContents', *SECTION])
+        contents = nav(section_list, [*CONTENT, 'musicPlaylistShelfRenderer']).get('contents') or []
+        tracks = parse_playlist_items(contents)
+    except Exception:
+        yield fetch_playlist(ytmusic, playlist_id, None).get('tracks') or []
+        return
+    yield tracks
+    continuation_token = get_continuation_token(contents) if contents else None
+    while continuation_token:
+        contents = nav(request({'continuation': continuation_token}), CONTINUATION_ITEMS, True)
+        if not contents:
+            break
+        tracks = parse_playlist_items(contents)
+        if not tracks:
+            break
+        yield tracks
+        continuation_token = get_continuation_token(contents)
 
-        liked_songs = ytmusic.get_liked_songs(limit=None)
-        liked_song_ids = {song['videoId']: song['title'] for song in liked_songs['tracks']}
-        total_liked_songs = len(liked_songs['tracks'])
+def playlist_signature(playlist: dict) -> Optional[str]:
+    """
+    Compute the change signal of a playlist from its first page.
 
-        print(f"Total number of songs in Liked Songs: {total_liked_songs}")
-        print("Adding songs to Liked Songs...")
+    Args:
+        playlist (dict): Playlist as returned by the YTMusic API, with at least its first page of tracks.
 
-        added_song_count = 0
-        for value in values:
-            if value in liked_song_ids:
-                print(f"Song: {liked_song_ids[value]} is already in Liked Songs. Skipping...")
-                continue
-            try:
-                song_info = ytmusic.get_song(value)
-                if 'videoDetails' not in song_info:
-                    print(f"Error: 'videoDetails' not found for song with ID {value}")
-                    continue
+    Returns:
+        Optional[str]: The signature, or None if the playlist does not report its track count.
+    """
+    if playlist.get('trackCount') is None:
+        return None
+    first_page = [track.get('videoId') for track in playlist.get('tracks') or []]
+    data = json.dumps([playlist['trackCount'], playlist.get('duration'), first_page])
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
 
-                song_details = song_info['videoDetails']
-                song_title = song_details.get('title', 'Unknown Title')
-                song_author = song_details.get('author', 'Unknown Author')
-                song_id = song_details.get('videoId', 'Unknown ID')
+def get_snapshot_store(ytmusic: YTMusic) -> Optional[PlaylistSnapshotStore]:
+    """
+    Get the playlist snapshot store of a YTMusic session.
 
-                print(f"Song: {song_title}, Artist: {song_author}")
-                print(f"URL: https://music.youtube.com/watch?v={song_id}")
-                print("Adding to Liked Songs...")
-                print("")
-                ytmusic.rate_song(song_id, 'LIKE')
-                added_song_count += 1
-            except Exception as e:
-                print(f"Error adding song {value} to Liked Songs: {e}")
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
 
-        print(f"Total number of songs added to Liked Songs: {added_song_count}")
-        print(f"Total number of songs in Liked Songs: {total_liked_songs + added_song_count}")
-    except Exception as e:
-        print(f"Error retrieving liked songs: {e}")
-    print("Finished adding songs to Liked Songs.")
+    Returns:
+        Optional[PlaylistSnapshotStore]: The store, or None if snapshots are not saved between runs.
+    """
+    return getattr(ytmusic, 'snapshot_store', None)
 
-def process_song(ytmusic: YTMusic, value: str, playlist_id: str, playlist_name: str) -> int:
+def get_playlist_snapshot(ytmusic: YTMusic, playlist_id: str) -> PlaylistSnapshot:
     """
-    Process a single song to add it to a playlist.
+    Fetch a playlist once and build an in-memory index of its contents.
+
+    With a snapshot store (--snapshot-cache), only the first page of the playlist
+    is fetched (plus one continuation page for playlists longer than a page, as
+    ytmusicapi pages limited fetches) when it still matches the snapshot saved
+    by an earlier run.
 
     Args:
         ytmusic (YTMusic): An authenticated instance of the YTMusic class.
-        value (str): ID of the song to process.
-        playlist_id (str): ID of the playlist to add the song to.
-        playlist_name (str): Name of the playlist.
+        playlist_id (str): ID of the playlist, 'LM' for Liked Songs.
 
     Returns:
-        int: 1 if the song was successfully added, 0 otherwise.
+        PlaylistSnapshot: Snapshot of the playlist.
     """
-    try:
-        song_info = ytmusic.get_song(value)
-        if 'videoDetails' not in song_info:
-            print(f"Error: 'videoDetails' not found for song with ID {value}")
-            return 0
-        
-        song_details = song_info['videoDetails']
-        song_title = song_details.get('title', 'Unknown Title')
-        song_author = song_details.get('author', 'Unknown Author')
-        song_id = song_details.get('videoId', 'Unknown ID')
-
-        playlist_songs = {song['videoId'] for song in get_playlist_songs(ytmusic, playlist_id)}
-        if value in playlist_songs:
-            print(f"Song: {song_title}, Artist: {song_author} has already been added to the playlist \"{playlist_name}\". Skipping...")
-            return 0
-        print(f"Song: {song_title}, Artist: {song_author}")
-        print(f"URL: https://music.youtube.com/watch?v={song_id}")
-        print(f"Adding to playlist: {playlist_name}, {playlist_id}")
-        print("")
+    store = get_snapshot_store(ytmusic)
+    with get_run_report(ytmusic).phase('playlist_fetch'):
         try:
-            ytmusic.add_playlist_items(playlist_id, [song_id])
+            if store is None:
+                playlist = fetch_playlist(ytmusic, playlist_id, None)
+            else:
+                playlist = fetch_playlist(ytmusic, playlist_id, 1)
+                signature = playlist_signature(playlist)
+                snapshot = store.load(playlist_id, signature)
+                if snapshot is not None:
+                    return snapshot
+                if signature is None or len(playlist.get('tracks') or []) < playlist['trackCount']:
+                    playlist = fetch_playlist(ytmusic, playlist_id, None)
         except Exception as e:
-            print(f"Error adding song {song_title} to playlist: {e}")
-            return 0
-        return 1
-    except Exception as e:
-        print(f"Error processing song with ID {value}: {e}")
-        return 0
+            print(f"Error getting songs from playlist: {e}")
+            exit()
+        title = 'Liked Songs' if playlist_id == 'LM' else playlist.get('title')
+        snapshot = PlaylistSnapshot(playlist_id, title, [Track.from_api(track) for track in playlist.get('tracks') or []])
+        if store is not None:
+            store.save(snapshot, signature)
+        return snapshot
+
+def save_playlist_snapshot(ytmusic: YTMusic, snapshot: PlaylistSnapshot) -> None:
+    """
+    Save a snapshot that was updated with this run's changes, so the next run does not download the playlist again.
+
+    The snapshot is only saved if the first page of the playlist still matches it,
+    otherwise the saved snapshot is discarded.
 
-def process_values(ytmusic: YTMusic, values: list, playlist_id: str, playlist_name: str, delete_duplicates: bool, track_count: int) -> None:
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        snapshot (PlaylistSnapshot): Snapshot to save.
     """
-    Process multiple songs and add them to a playlist.
+    store = get_snapshot_store(ytmusic)
+    if store is None:
+        return
+    signature = None
+    if not snapshot.stale:
+        try:
+            playlist = fetch_playlist(ytmusic, snapshot.id, 1)
+        except Exception as e:
+            print(f"Error getting songs from playlist: {e}")
+            playlist = {}
+        first_page = [track.get('videoId') for track in playlist.get('tracks') or []]
+        if playlist.get('trackCount') == len(snapshot.tracks) and first_page == [track.video_id for track in snapshot.tracks[:len(first_page)]]:
+            signature = playlist_signature(playlist)
+    store.save(snapshot, signature)
+
+def get_playlist_name(ytmusic: YTMusic, playlist_id: str, snapshot: PlaylistSnapshot = None) -> str:
+    """
+    Get the name of a playlist.
 
     Args:
         ytmusic (YTMusic): An authenticated instance of the YTMusic class.
-        values (list): List of song IDs to process.
-        playlist_id (str): ID of the playlist to add songs to.
-        playlist_name (str): Name of the playlist.
-        delete_duplicates (bool): Whether to delete duplicate songs from the playlist.
-        track_count (int): Number of tracks in the playlist before adding new songs.
+        playlist_id (str): ID of the playlist.
+        snapshot (PlaylistSnapshot, optional): Playlist snapshot to take the name from. Defaults to None.
+
+    Returns:
+        str: Name of the playlist.
     """
-    if delete_duplicates:
-        delete_duplicate_song(ytmusic, playlist_id, auto_delete=True)
+    if snapshot is not None and snapshot.title:
+        return snapshot.title
+    try:
+        playlist = get_playlist_catalog(ytmusic).get(playlist_id)
+    except Exception as e:
+        print(f"Error getting library playlists: {e}")
+        exit()
+    if playlist is None or playlist['playlistId'] != playlist_id:
+        print("Error: The specified playlist ID does not exist.")
+        exit()
+    return playlist['title']
 
-    print(f"Total number of songs in the playlist: {track_count}")
-    print(f"Adding songs to playlist: {playlist_name}...")
+class SongMetadataCache:
+    """
+    Persistent SQLite cache of song details keyed by videoId, and of search
+    matches keyed by normalized (title, artist).
 
-    song_count = 0
-    for value in values:
-        song_count += process_song(ytmusic, value, playlist_id, playlist_name)
+    Entries expire after a TTL and the least recently used entries are evicted
+    once the cache grows past its size cap.
+    """
 
-    print(f"Total number of songs added: {song_count}")
-    print(f"Total number of songs in the playlist: {track_count + song_count}")
+    def __init__(self, path: str = METADATA_CACHE_FILE, ttl: float = DEFAULT_CACHE_TTL, max_entries: int = DEFAULT_CACHE_SIZE, refresh: bool = False) -> None:
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path (str, optional): Path of the SQLite database. Defaults to METADATA_CACHE_FILE.
+            ttl (float, optional): Number of seconds an entry stays valid. Defaults to DEFAULT_CACHE_TTL.
+            max_entries (int, optional): Maximum number of entries to keep. Defaults to DEFAULT_CACHE_SIZE.
+            refresh (bool, optional): Ignore existing entries and overwrite them with fresh lookups. Defaults to False.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._uncommitted = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS songs ("
+            "song_id TEXT PRIMARY KEY, video_id TEXT, title TEXT, author TEXT, "
+            "fetched_at REAL, last_used REAL)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS search_matches ("
+            "query TEXT PRIMARY KEY, video_id TEXT, fetched_at REAL, last_used REAL)"
+        )
+        self._connection.commit()
+
+    def get(self, song_id: str) -> Optional[dict]:
+        """
+        Get the cached details of a song.
+
+        Args:
+            song_id (str): ID of the song.
+
+        Returns:
+            Optional[dict]: The song details, or None if the song is not cached or its entry expired.
+        """
+        if self.refresh:
+            self.misses += 1
+            return None
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT video_id, title, author FROM songs WHERE song_id = ? AND fetched_at >= ?",
+                (song_id, now - self.ttl),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._connection.execute("UPDATE songs SET last_used = ? WHERE song_id = ?", (now, song_id))
+            self.hits += 1
+        return {'videoId': row[0], 'title': row[1], 'author': row[2]}
+
+    def put(self, song_id: str, song: dict) -> None:
+        """
+        Store the details of a song.
+
+        Args:
+            song_id (str): ID of the song.
+            song (dict): Details of the song ('videoId', 'title' and 'author').
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO songs (song_id, video_id, title, author, fetched_at, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                (song_id, song['videoId'], song['title'], song['author'], now, now),
+            )
+            self._written()
+
+    def get_match(self, title: str, artist: str) -> Optional[str]:
+        """
+        Get the cached search match of a song.
+
+        Args:
+            title (str): Title of the song.
+            artist (str): Artist of the song.
+
+        Returns:
+            Optional[str]: The videoId of the match, an empty string if an earlier search found no
+                match, or None if the song was not searched yet or its entry expired.
+        """
+        if self.refresh:
+            return None
+        query = search_match_key(title, artist)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT video_id FROM search_matches WHERE query = ? AND fetched_at >= ?",
+                (query, now - self.ttl),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE search_matches SET last_used = ? WHERE query = ?", (now, query))
+        return row[0] or ''
+
+    def put_match(self, title: str, artist: str, video_id: Optional[str]) -> None:
+        """
+        Store the search match of a song.
+
+        Args:
+            title (str): Title of the song.
+            artist (str): Artist of the song.
+            video_id (Optional[str]): The videoId of the match, None if the search found no match.
+        """
+        query = search_match_key(title, artist)
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO search_matches (query, video_id, fetched_at, last_used) VALUES (?, ?, ?, ?)",
+                (query, video_id, now, now),
+            )
+            self._written()
+
+    def _written(self) -> None:
+        # Called with the lock held after each stored entry.
+        self._uncommitted += 1
+        if self._uncommitted >= CACHE_COMMIT_INTERVAL:
+            self._connection.commit()
+            self._uncommitted = 0
+
+    def close(self) -> None:
+        """
+        Drop expired entries, evict the least recently used entries over the size cap and close the database.
+        """
+        with self._lock:
+            for table, key in (('songs', 'song_id'), ('search_matches', 'query')):
+                self._connection.execute(f"DELETE FROM {table} WHERE fetched_at < ?", (time.time() - self.ttl,))
+                self._connection.execute(
+                    f"DELETE FROM {table} WHERE {key} NOT IN (SELECT {key} FROM {table} ORDER BY last_used DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+            self._connection.commit()
+            self._connection.close()
+
+class ImportJournal:
+    """
+    Append-only journal of the songs handled by an import.
 
-    if delete_duplicates:
-        delete_duplicate_song(ytmusic, playlist_id, auto_delete=True)
+    Each (CSV file, playlist) pair gets its own journal, so an interrupted
+    import can be resumed without handling the songs that are already done.
+    """
 
-def similar_song_titles(title1: str, title2: str) -> bool:
+    DONE_STATUSES = ('added', 'skipped')
+    # Paths of the journals of the imports of this run that have not finished, so an
+    # interrupted run only suggests --resume when there is an import to resume.
+    unfinished = set()
+
+    def __init__(self, csv_path: str, playlist_id: str, resume: bool = False, directory: str = JOURNAL_DIR) -> None:
+        """
+        Open the journal of an import.
+
+        Args:
+            csv_path (str): Path of the CSV file being imported.
+            playlist_id (str): ID of the playlist the songs are added to.
+            resume (bool, optional): Load the existing journal instead of starting a new one. Defaults to False.
+            directory (str, optional): Directory to keep the journals in. Defaults to JOURNAL_DIR.
+        """
+        digest = hashlib.sha256()
+        with open(csv_path, 'rb') as csv_file:
+            for chunk in iter(lambda: csv_file.read(1 << 20), b''):
+                digest.update(chunk)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{digest.hexdigest()[:16]}_{playlist_id}.jsonl")
+        self.statuses = {}
+        if resume and os.path.isfile(self.path):
+            with open(self.path, encoding='utf-8') as journal_file:
+                for line in journal_file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # The last line may be cut short if the previous run was killed mid-write.
+                        continue
+                    self.statuses[entry['id']] = entry['status']
+        self._lock = threading.Lock()
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+        ImportJournal.unfinished.add(self.path)
+
+    def is_done(self, song_id: str) -> bool:
+        """
+        Check whether a song was already added or skipped by a previous run.
+
+        Args:
+            song_id (str): ID of the song.
+
+        Returns:
+            bool: True if the song does not have to be handled again, False otherwise.
+        """
+        return self.statuses.get(song_id) in self.DONE_STATUSES
+
+    def pending(self, values: Iterable[str]) -> Generator[str, None, None]:
+        """
+        Filter out the songs that are already done.
+
+        Args:
+            values (Iterable[str]): IDs of the songs to import.
+
+        Yields:
+            str: IDs of the songs that still have to be handled.
+        """
+        for value in values:
+            if not self.is_done(value):
+                yield value
+
+    def record(self, song_id: str, status: str) -> None:
+        """
+        Record the outcome of a song.
+
+        Args:
+            song_id (str): ID of the song.
+            status (str): Outcome of the song: 'added', 'skipped' or 'failed'.
+        """
+        with self._lock:
+            self.statuses[song_id] = status
+            self._file.write(json.dumps({'id': song_id, 'status': status}) + '\n')
+            self._file.flush()
+
+    def finish(self) -> None:
+        """
+        Mark the import as finished, so an interruption later in the run does not suggest resuming it.
+        """
+        ImportJournal.unfinished.discard(self.path)
+
+    def close(self) -> None:
+        """
+        Close the journal file.
+        """
+        self._file.close()
+
+def fetch_song_details(ytmusic: YTMusic, song_id: str) -> Tuple[Optional[dict], Optional[str]]:
     """
-    Check if two song titles are similar.
+    Fetch the details of a song.
 
     Args:
-        title1 (str): First song title.
-        title2 (str): Second song title.
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        song_id (str): ID of the song.
 
     Returns:
-        bool: True if the titles are similar, False otherwise.
+        Tuple[Optional[dict], Optional[str]]: The song details ('videoId', 'title' and 'author')
+            and None, or None and an error message if the details could not be fetched.
     """
-    title1 = title1.lower().strip()
-    title2 = title2.lower().strip()
-    
-    ratio = difflib.SequenceMatcher(None, title1, title2).ratio()
+    try:
+        song_info = ytmusic.get_song(song_id)
+    except Exception as e:
+        return None, str(e)
+    if 'videoDetails' not in song_info:
+        return None, f"'videoDetails' not found for song with ID {song_id}"
+    song_details = song_info['videoDetails']
+    return {
+        'videoId': song_details.get('videoId', song_id),
+        'title': song_details.get('title', 'Unknown Title'),
+        'author': song_details.get('author', 'Unknown Author'),
+    }, None
+
+def map_bounded(function: Callable[[Any], Any], items: Iterable[Any], workers: int = 1, max_in_flight: int = None, precomputed: Callable[[Any], Any] = None) -> Generator[Tuple[Any, Any], None, None]:
+    """
+    Apply a function to items on a bounded thread pool, keeping the input order.
 
-    similarity_threshold = 0.8
-    return ratio >= similarity_threshold
+    Args:
+        function (Callable[[Any], Any]): Function to apply. It should handle its own errors.
+        items (Iterable[Any]): Items to apply the function to. Consumed lazily.
+        workers (int, optional): Number of calls to run concurrently. Defaults to 1.
+        max_in_flight (int, optional): Maximum number of items submitted but not yet consumed.
+            Defaults to the number of workers.
+        precomputed (Callable[[Any], Any], optional): Returns the result of an item without calling
+            the function (for example from a cache), or None to call it. Defaults to None.
 
-def delete_duplicate_song(ytmusic: YTMusic, playlist_id: str, auto_delete: bool = False) -> None:
+    Yields:
+        Tuple[Any, Any]: Each item and the result of the function.
     """
-    Delete duplicate/similar songs from a playlist.
+    if workers <= 1:
+        for item in items:
+            result = precomputed(item) if precomputed is not None else None
+            yield item, result if result is not None else function(item)
+        return
+
+    max_in_flight = max(max_in_flight or workers, 1)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    in_flight = deque()
+    try:
+        for item in items:
+            result = precomputed(item) if precomputed is not None else None
+            if result is not None:
+                future = Future()
+                future.set_result(result)
+            else:
+                future = executor.submit(function, item)
+            in_flight.append((item, future))
+            if len(in_flight) >= max_in_flight:
+                item, future = in_flight.popleft()
+                yield item, future.result()
+        while in_flight:
+            item, future = in_flight.popleft()
+            yield item, future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def resolve_song_details(ytmusic: YTMusic, values: Iterable[str], workers: int = 1, max_in_flight: int = None, cache: SongMetadataCache = None) -> Generator[Tuple[str, Optional[dict], Optional[str]], None, None]:
+    """
+    Resolve the details of songs ahead of the write stage, keeping the input order.
 
     Args:
         ytmusic (YTMusic): An authenticated instance of the YTMusic class.
-        playlist_id (str): ID of the playlist to check for duplicates.
-        auto_delete (bool, optional): Whether to automatically delete duplicate songs. Defaults to False.
+        values (Iterable[str]): IDs of the songs to resolve.
+        workers (int, optional): Number of lookups to run concurrently. Defaults to 1.
+        max_in_flight (int, optional): Maximum number of lookups submitted but not yet consumed.
+            Defaults to the number of workers.
+        cache (SongMetadataCache, optional): Cache to answer lookups from and to store new details in. Defaults to None.
+
+    Yields:
+        Tuple[str, Optional[dict], Optional[str]]: The song ID, its details and an error message,
+            see fetch_song_details.
+    """
+    def lookup(value: str) -> Tuple[Optional[dict], Optional[str]]:
+        song, error = fetch_song_details(ytmusic, value)
+        if cache is not None and song is not None:
+            cache.put(value, song)
+        return song, error
+
+    def cached(value: str) -> Optional[Tuple[dict, None]]:
+        song = cache.get(value) if cache is not None else None
+        return (song, None) if song is not None else None
+
+    for value, (song, error) in map_bounded(lookup, values, workers, max_in_flight, cached):
+        yield value, song, error
+
+def rate_songs(ytmusic: YTMusic, song_ids: Iterable[str], rating: str, workers: int = 1, max_in_flight: int = None) -> Generator[Tuple[str, Optional[str]], None, None]:
+    """
+    Rate songs concurrently, keeping the input order.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        song_ids (Iterable[str]): IDs of the songs to rate.
+        rating (str): Rating to give: 'LIKE', 'DISLIKE' or 'INDIFFERENT'.
+        workers (int, optional): Number of requests to run concurrently. Defaults to 1.
+        max_in_flight (int, optional): Maximum number of requests in flight. Defaults to the number of workers.
+
+    Yields:
+        Tuple[str, Optional[str]]: Each song ID and an error message, None if the song was rated.
+    """
+    def rate(song_id: str) -> Optional[str]:
+        try:
+            ytmusic.rate_song(song_id, rating)
+        except Exception as e:
+            return str(e)
+        return None
+
+    yield from map_bounded(rate, song_ids, workers, max_in_flight)
+
+def rank_search_results(row: dict, results: list) -> Optional[dict]:
+    """
+    Pick the search result that best matches a CSV row.
+
+    The title, artist and album of each result are compared with those of the row
+    after the same normalization as the duplicate detection. The row's values are
+    set once as the second sequence of a SequenceMatcher, which difflib indexes
+    only once for all results, and results whose title cannot reach
+    SIMILARITY_THRESHOLD are skipped with the cheap upper bounds of the ratio.
+
+    Args:
+        row (dict): Row with a 'title' and optionally an 'artist' and an 'album'.
+        results (list): Song search results as returned by the YTMusic API.
+
+    Returns:
+        Optional[dict]: Details of the best match ('videoId', 'title' and 'author'), or None if
+            no result scores at least SEARCH_MIN_SCORE.
+    """
+    title_matcher = difflib.SequenceMatcher(None, b=normalize_title(row['title']))
+    artist = row.get('artist') or ''
+    artists = {normalize_name(artist), normalize_name(ARTIST_SEPARATOR_PATTERN.split(artist)[0])} - {''}
+    artist_matchers = [difflib.SequenceMatcher(None, b=name) for name in artists]
+    album = normalize_name(row.get('album'))
+    total_weight = SEARCH_WEIGHTS['title'] + (SEARCH_WEIGHTS['artist'] if artist_matchers else 0) + (SEARCH_WEIGHTS['album'] if album else 0)
+
+    best, best_score = None, SEARCH_MIN_SCORE
+    for result in results:
+        if not result.get('videoId'):
+            continue
+        title_matcher.set_seq1(normalize_title(result.get('title')))
+        title_score = similarity_score(title_matcher)
+        if not title_score:
+            continue
+        score = SEARCH_WEIGHTS['title'] * title_score
+        result_artists = [artist.get('name') or '' for artist in result.get('artists') or []]
+        if artist_matchers:
+            names = {normalize_name(' '.join(result_artists))} | {normalize_name(name) for name in result_artists}
+            artist_score = 0.0
+            for matcher in artist_matchers:
+                for name in names:
+                    matcher.set_seq1(name)
+                    artist_score = max(artist_score, matcher.ratio())
+            score += SEARCH_WEIGHTS['artist'] * artist_score
+        if album and normalize_name((result.get('album') or {}).get('name')) == album:
+            score += SEARCH_WEIGHTS['album']
+        score /= total_weight
+        if score >= best_score:
+            best, best_score = {'videoId': result['videoId'], 'title': result.get('title') or 'Unknown Title',
+                                'author': ', '.join(result_artists) or 'Unknown Author'}, score
+    return best
+
+def search_song(ytmusic: YTMusic, row: dict) -> Tuple[Optional[dict], Optional[str]]:
     """
+    Search YouTube Music for the song of a CSV row, by ISRC first if the row has one, then by title and artist.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        row (dict): Row with a 'title' and optionally an 'artist', an 'album' and an 'isrc'.
+
+    Returns:
+        Tuple[Optional[dict], Optional[str]]: The details of the best match ('videoId', 'title' and
+            'author') or None if nothing matched, and an error message if a search failed.
+    """
+    queries = [row['isrc']] if row.get('isrc') else []
+    queries.append(' '.join(value for value in (row['title'], row.get('artist')) if value))
     try:
-        playlist = ytmusic.get_playlist(playlist_id, limit=None)
+        for query in queries:
+            match = rank_search_results(row, ytmusic.search(query, filter='songs', limit=SEARCH_RESULT_LIMIT))
+            if match is not None:
+                return match, None
+    except Exception as e:
+        return None, str(e)
+    return None, None
+
+def resolve_song_rows(ytmusic: YTMusic, rows: Iterable[dict], workers: int = 1, max_in_flight: int = None, cache: SongMetadataCache = None) -> Generator[str, None, None]:
+    """
+    Get the song ID of each CSV row, searching YouTube Music for the rows without one.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        rows (Iterable[dict]): Rows, see read_song_rows.
+        workers (int, optional): Number of searches to run concurrently. Defaults to 1.
+        max_in_flight (int, optional): Maximum number of searches submitted but not yet consumed.
+            Defaults to the number of workers.
+        cache (SongMetadataCache, optional): Cache to answer searches from and to store new matches in. Defaults to None.
+
+    Yields:
+        str: The song ID of each row, in row order. Rows without a match are reported and skipped.
+    """
+    report = get_run_report(ytmusic)
+    # Matches found during this run, so repeated rows are searched once even without the cache.
+    matches = {}
+
+    def search(row: dict) -> Tuple[Optional[dict], Optional[str]]:
+        key = search_match_key(row['title'], row.get('artist'))
+        if key in matches:
+            return matches[key], None
+        song, error = search_song(ytmusic, row)
+        if error is None:
+            matches[key] = song
+        if cache is not None and error is None:
+            cache.put_match(row['title'], row.get('artist'), song['videoId'] if song is not None else None)
+            if song is not None:
+                cache.put(song['videoId'], song)
+        return song, error
+
+    def known(row: dict) -> Optional[Tuple[Optional[dict], Optional[str]]]:
+        if row.get('videoId'):
+            return {'videoId': row['videoId']}, None
+        if not row.get('title'):
+            return None, "the row has no song ID and no title"
+        key = search_match_key(row['title'], row.get('artist'))
+        if key in matches:
+            return matches[key], None
+        video_id = cache.get_match(row['title'], row.get('artist')) if cache is not None else None
+        if video_id is None:
+            return None
+        return ({'videoId': video_id} if video_id else None), None
+
+    for row, (song, error) in report.timed('search', map_bounded(search, rows, workers, max_in_flight, known)):
+        if song is not None:
+            yield song['videoId']
+            continue
+        description = f"'{row.get('title') or 'Unknown Title'}' by '{row.get('artist') or 'Unknown Artist'}'"
+        report.song('unmatched', f"Error searching for {description}: {error}" if error else f"No match found for {description}. Skipping...")
+
+def add_to_liked_songs(ytmusic: YTMusic, values: Iterable[str], workers: int = 1, max_in_flight: int = None, cache: SongMetadataCache = None, journal: ImportJournal = None, assume_yes: bool = False, fast: bool = False, unlike_missing: bool = False) -> None:
+    """
+    Add songs to Liked Songs.
+
+    The CSV songs are compared with a single snapshot of Liked Songs and only the
+    missing songs are liked.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        values (Iterable[str]): Song IDs to be added.
+        workers (int, optional): Number of song lookups and likes to run concurrently. Defaults to 1.
+        max_in_flight (int, optional): Maximum number of requests in flight. Defaults to the number of workers.
+        cache (SongMetadataCache, optional): Cache of song details. Defaults to None.
+        journal (ImportJournal, optional): Journal to record the outcome of each song in. Defaults to None.
+        assume_yes (bool, optional): Do not ask for confirmation. Defaults to False.
+        fast (bool, optional): Like the song IDs without looking up their details first. Defaults to False.
+        unlike_missing (bool, optional): Also unlike the liked songs that are not in the CSV file,
+            so Liked Songs mirrors the CSV file. Defaults to False.
+    """
+    if not assume_yes:
+        action = "make Liked Songs match the CSV file" if unlike_missing else "add these songs to Liked Songs"
+        confirmation = input(f"Are you sure you want to {action}? (yes/no): ").strip().lower()
+        if confirmation not in ["yes", "y"]:
+            print("Operation canceled.")
+            return
 
-        song_info_map = {}
-        for item in playlist['tracks']:
-            title = item['title'].strip().lower()
-            if title in song_info_map:
-                song_info_map[title].append(item)
+    report = get_run_report(ytmusic)
+    snapshot = get_playlist_snapshot(ytmusic, 'LM')
+    liked_song_ids = {track.video_id: track.title for track in snapshot.tracks}
+    total_liked_songs = len(liked_song_ids)
+
+    print(f"Total number of songs in Liked Songs: {total_liked_songs}")
+    print("Adding songs to Liked Songs...")
+
+    if unlike_missing:
+        values = list(values)
+        csv_song_ids = set(values)
+    if journal is not None:
+        values = journal.pending(values)
+
+    def songs_to_like():
+        for value in values:
+            if value in liked_song_ids:
+                report.song('skipped', f"Song: {liked_song_ids[value]} is already in Liked Songs. Skipping...")
+                if journal is not None:
+                    journal.record(value, 'skipped')
+                continue
+            yield value
+
+    if fast:
+        resolved = ((value, {'videoId': value, 'title': None, 'author': None}, None) for value in songs_to_like())
+    else:
+        resolved = resolve_song_details(ytmusic, songs_to_like(), workers, max_in_flight, cache)
+    resolved = report.timed('metadata_resolution', resolved)
+
+    def songs_to_rate():
+        for value, song, error in resolved:
+            if song is None:
+                report.song('failed', f"Error: {error}")
+                if journal is not None:
+                    journal.record(value, 'failed')
+                continue
+            yield song
+
+    songs = deque()
+
+    def song_ids_to_rate():
+        for song in songs_to_rate():
+            songs.append(song)
+            yield song['videoId']
+
+    added_song_count = 0
+    liked_tracks = []
+    for song_id, error in report.timed('writes', rate_songs(ytmusic, song_ids_to_rate(), 'LIKE', workers, max_in_flight)):
+        song = songs.popleft()
+        if error is None:
+            report.song('added', format_song(song), f"URL: https://music.youtube.com/watch?v={song_id}", "Added to Liked Songs.", "")
+            added_song_count += 1
+            liked_tracks.append(Track(song_id, None, song['title'], song['author']))
+        else:
+            report.song('failed', f"Error adding song {song['title'] or song_id} to Liked Songs: {error}")
+        if journal is not None:
+            journal.record(song_id, 'added' if error is None else 'failed')
+
+    removed_song_count = 0
+    unliked_song_ids = set()
+    if unlike_missing:
+        to_unlike = [song_id for song_id in liked_song_ids if song_id not in csv_song_ids]
+        print(f"Removing {len(to_unlike)} songs that are not in the CSV file from Liked Songs...")
+        for song_id, error in report.timed('writes', rate_songs(ytmusic, to_unlike, 'INDIFFERENT', workers, max_in_flight)):
+            if error is None:
+                report.song('removed', f"Song: {liked_song_ids[song_id]} has been removed from Liked Songs.")
+                removed_song_count += 1
+                unliked_song_ids.add(song_id)
             else:
-                song_info_map[title] = [item]
-
-        print(f"Checking for duplicate songs in playlist: {playlist['title']}...")
-
-        for title, song_info_list in song_info_map.items():
-            if len(song_info_list) > 1:
-                for i, song_info in enumerate(song_info_list):
-                    for other_song_info in song_info_list[i + 1:]:
-                        if similar_song_titles(song_info['title'], other_song_info['title']) and \
-                                similar_song_titles(song_info['artists'][0]['name'], other_song_info['artists'][0]['name']):
-                            print(f"Similar songs found: '{song_info['title']}' - '{song_info['artists'][0]['name']}' "
-                                  f"and '{other_song_info['title']}' - '{other_song_info['artists'][0]['name']}'")
-                            song = song_info
-                            if auto_delete:
-                                ytmusic.remove_playlist_items(playlist_id, [{'videoId': song['videoId'], 'setVideoId': song['setVideoId']}])
-                                print(f"Song: '{song['title']}' - '{song['artists'][0]['name']}' has been deleted from the playlist.")
-                            else:
-                                delete = input("Do you want to delete one of the similar songs from the playlist? (yes/no): ")
-                                if delete.strip().lower() in ["yes", "y"]:
-                                    ytmusic.remove_playlist_items(playlist_id, [{'videoId': song['videoId'], 'setVideoId': song['setVideoId']}])
-                                    print(f"Song: '{song['title']}' - '{song['artists'][0]['name']}' has been deleted from the playlist.")
-                                else:
-                                    print("Operation canceled.")
-                            break
-        if not auto_delete:
-            print("No more duplicate songs found.")
-        print("Finished checking for duplicate songs.")
+                report.song('failed', f"Error removing song {liked_song_ids[song_id]} from Liked Songs: {error}")
+        report.end_progress()
+        print(f"Total number of songs removed from Liked Songs: {removed_song_count}")
+
+    if liked_tracks or unliked_song_ids:
+        # Newly liked songs are listed first in Liked Songs.
+        snapshot.set_tracks(liked_tracks[::-1] + [track for track in snapshot.tracks if track.video_id not in unliked_song_ids])
+        save_playlist_snapshot(ytmusic, snapshot)
+
+    report.end_progress()
+    print(f"Total number of songs added to Liked Songs: {added_song_count}")
+    print(f"Total number of songs in Liked Songs: {total_liked_songs + added_song_count - removed_song_count}")
+    print("Finished adding songs to Liked Songs.")
+
+def format_song(song: dict) -> str:
+    """
+    Format a song for display.
+
+    Args:
+        song (dict): Details of the song. The title and author may be None when they were not looked up.
+
+    Returns:
+        str: The title and artist of the song, or its ID if the title is not known.
+    """
+    if song.get('title') is None:
+        return f"Song ID: {song['videoId']}"
+    return f"Song: {song['title']}, Artist: {song['author']}"
+
+def process_song(value: str, song: Optional[dict], error: Optional[str], playlist_name: str, playlist_song_ids: set, report: RunReport = None) -> str:
+    """
+    Decide whether a resolved song has to be added to a playlist.
+
+    Args:
+        value (str): ID of the song to process.
+        song (Optional[dict]): Details of the song, None if they could not be resolved.
+        error (Optional[str]): Error message of the lookup if the details could not be resolved.
+        playlist_name (str): Name of the playlist.
+        playlist_song_ids (set): IDs of the songs already in the playlist.
+        report (RunReport, optional): Report to record skipped and failed songs in. Defaults to a new report.
 
+    Returns:
+        str: The outcome for the song: 'queued', 'skipped' or 'failed'.
+    """
+    if report is None:
+        report = RunReport()
+    if song is None:
+        report.song('failed', f"Error processing song with ID {value}: {error}")
+        return 'failed'
+    if value in playlist_song_ids:
+        report.song('skipped', f"{format_song(song)} has already been added to the playlist \"{playlist_name}\". Skipping...")
+        return 'skipped'
+    return 'queued'
+
+def add_playlist_items_batch(ytmusic: YTMusic, playlist_id: str, song_ids: list) -> Tuple[dict, dict]:
+    """
+    Add a batch of songs to a playlist in a single request.
+
+    If the request fails, the batch is split in half and each half is retried,
+    so a single bad ID only fails itself.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        playlist_id (str): ID of the playlist to add the songs to.
+        song_ids (list): IDs of the songs to add.
+
+    Returns:
+        Tuple[dict, dict]: Error message for each song ID that could not be added, and the
+            setVideoId of each song ID that was added.
+    """
+    if not song_ids:
+        return {}, {}
+    try:
+        response = ytmusic.add_playlist_items(playlist_id, song_ids)
+        status = response.get('status', '') if isinstance(response, dict) else str(response)
+        if 'SUCCEEDED' not in status:
+            raise Exception(f"unexpected response status '{status or response}'")
+        set_video_ids = {result['videoId']: result.get('setVideoId') for result in response.get('playlistEditResults') or [] if result}
+        return {}, set_video_ids
     except Exception as e:
-        print(f"Error deleting duplicate songs from playlist: {e}")
+        if len(song_ids) == 1:
+            return {song_ids[0]: str(e)}, {}
+    middle = len(song_ids) // 2
+    errors, set_video_ids = add_playlist_items_batch(ytmusic, playlist_id, song_ids[:middle])
+    more_errors, more_set_video_ids = add_playlist_items_batch(ytmusic, playlist_id, song_ids[middle:])
+    errors.update(more_errors)
+    set_video_ids.update(more_set_video_ids)
+    return errors, set_video_ids
+
+def remove_playlist_items_batch(ytmusic: YTMusic, playlist_id: str, items: list, batch_size: int = DEFAULT_BATCH_SIZE) -> set:
+    """
+    Remove songs from a playlist in chunked bulk requests.
+
+    If a request fails, the chunk is split in half and each half is retried,
+    so a single bad item only fails itself.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        playlist_id (str): ID of the playlist to remove the songs from.
+        items (list): Playlist items to remove, each with a 'videoId' and a 'setVideoId'.
+        batch_size (int, optional): Number of items to remove per request. Defaults to DEFAULT_BATCH_SIZE.
+
+    Returns:
+        set: setVideoIds of the items that were removed.
+    """
+    removed = set()
+    for start in range(0, len(items), batch_size):
+        chunk = items[start:start + batch_size]
+        try:
+            response = ytmusic.remove_playlist_items(playlist_id, [{'videoId': item['videoId'], 'setVideoId': item['setVideoId']} for item in chunk])
+            status = response.get('status', '') if isinstance(response, dict) else str(response)
+            if 'SUCCEEDED' not in status:
+                raise Exception(f"unexpected response status '{status or response}'")
+            removed.update(item['setVideoId'] for item in chunk)
+        except Exception as e:
+            if len(chunk) == 1:
+                print(f"Error removing song {chunk[0].get('title', chunk[0]['videoId'])} from playlist: {e}")
+                continue
+            removed.update(remove_playlist_items_batch(ytmusic, playlist_id, chunk, max(len(chunk) // 2, 1)))
+    return removed
+
+def flush_song_batch(ytmusic: YTMusic, batch: list, playlist_id: str, playlist_name: str, snapshot: PlaylistSnapshot, outcomes: dict, journal: ImportJournal = None) -> None:
+    """
+    Add the queued songs to a playlist and record the outcome of each song.
 
-def check_duplicates(ytmusic: YTMusic, delete_duplicates: bool) -> None:
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        batch (list): Details of the songs to add. Emptied once the batch has been sent.
+        playlist_id (str): ID of the playlist to add the songs to.
+        playlist_name (str): Name of the playlist.
+        snapshot (PlaylistSnapshot): Snapshot of the playlist, updated as songs are added.
+        outcomes (dict): Counts of 'added' and 'skipped' songs and the list of 'failed' songs to record the outcomes in.
+        journal (ImportJournal, optional): Journal to record the outcome of each song in. Defaults to None.
+    """
+    if not batch:
+        return
+    report = get_run_report(ytmusic)
+    with report.phase('writes'):
+        errors, set_video_ids = add_playlist_items_batch(ytmusic, playlist_id, [song['videoId'] for song in batch])
+    for song in batch:
+        error = errors.get(song['videoId'])
+        if error is None:
+            report.song('added', format_song(song), f"URL: https://music.youtube.com/watch?v={song['videoId']}",
+                        f"Added to playlist: {playlist_name}, {playlist_id}", "")
+            set_video_id = set_video_ids.get(song['videoId'])
+            if song['title'] is None or set_video_id is None:
+                # Without a title or setVideoId the track cannot be checked for duplicates or removed.
+                snapshot.stale = True
+                snapshot.song_ids.add(song['videoId'])
+            else:
+                snapshot.add_track(Track(song['videoId'], set_video_id, song['title'], song['author']))
+            outcomes['added'] += 1
+        else:
+            report.song('failed', f"Error adding song {song['title'] or song['videoId']} to playlist: {error}")
+            outcomes['failed'].append(dict(song, error=error))
+        if journal is not None:
+            journal.record(song['videoId'], 'added' if error is None else 'failed')
+    batch.clear()
+
+def process_values(ytmusic: YTMusic, values: Iterable[str], playlist_id: str, playlist_name: str, delete_duplicates: bool, snapshot: PlaylistSnapshot, batch_size: int = DEFAULT_BATCH_SIZE, workers: int = 1, max_in_flight: int = None, cache: SongMetadataCache = None, fast: bool = False, journal: ImportJournal = None) -> None:
+    """
+    Process multiple songs and add them to a playlist.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        values (Iterable[str]): Song IDs to process.
+        playlist_id (str): ID of the playlist to add songs to.
+        playlist_name (str): Name of the playlist.
+        delete_duplicates (bool): Whether to delete duplicate songs from the playlist.
+        snapshot (PlaylistSnapshot): Snapshot of the playlist taken before adding new songs.
+        batch_size (int, optional): Number of songs to add per request. Defaults to DEFAULT_BATCH_SIZE.
+        workers (int, optional): Number of song lookups to run concurrently. Defaults to 1.
+        max_in_flight (int, optional): Maximum number of song lookups in flight. Defaults to the number of workers.
+        cache (SongMetadataCache, optional): Cache of song details. Defaults to None.
+        fast (bool, optional): Add the song IDs without looking up their details first. Titles are only
+            looked up for songs that failed. Defaults to False.
+        journal (ImportJournal, optional): Journal to record the outcome of each song in. Songs the journal
+            marks as done are not processed again. Defaults to None.
+    """
+    if delete_duplicates:
+        delete_duplicate_song(ytmusic, playlist_id, auto_delete=True, snapshot=snapshot, batch_size=batch_size)
+
+    report = get_run_report(ytmusic)
+    track_count = snapshot.track_count
+    print(f"Total number of songs in the playlist: {track_count}")
+    print(f"Adding songs to playlist: {playlist_name}...")
+
+    # Only failed songs are kept, for the title lookup and the summary, so memory does not grow with the CSV file.
+    outcomes = {'added': 0, 'skipped': 0, 'failed': []}
+    batch = []
+    if journal is not None:
+        values = journal.pending(values)
+    playlist_tracks = {track.video_id: track for track in snapshot.tracks}
+
+    def songs_to_add():
+        # Songs already in the playlist are skipped before their details are looked up.
+        for value in values:
+            if value in snapshot.song_ids:
+                track = playlist_tracks.get(value)
+                song = {'videoId': value, 'title': track.title if track is not None else None,
+                        'author': get_artist_name(track) if track is not None else None}
+                process_song(value, song, None, playlist_name, snapshot.song_ids, report)
+                outcomes['skipped'] += 1
+                if journal is not None:
+                    journal.record(value, 'skipped')
+                continue
+            yield value
+
+    if fast:
+        resolved = ((value, {'videoId': value, 'title': None, 'author': None}, None) for value in songs_to_add())
+    else:
+        resolved = resolve_song_details(ytmusic, songs_to_add(), workers, max_in_flight, cache)
+    for value, song, error in report.timed('metadata_resolution', resolved):
+        status = process_song(value, song, error, playlist_name, snapshot.song_ids, report)
+        if status == 'queued':
+            batch.append(song)
+            if len(batch) >= batch_size:
+                flush_song_batch(ytmusic, batch, playlist_id, playlist_name, snapshot, outcomes, journal)
+            continue
+        elif status == 'skipped':
+            outcomes['skipped'] += 1
+        else:
+            outcomes['failed'].append({'videoId': value, 'title': 'Unknown Title', 'author': 'Unknown Author', 'error': error})
+        if journal is not None:
+            journal.record(value, status)
+    flush_song_batch(ytmusic, batch, playlist_id, playlist_name, snapshot, outcomes, journal)
+
+    report.end_progress()
+    unresolved = [song for song in outcomes['failed'] if song['title'] is None]
+    if unresolved:
+        with report.phase('metadata_resolution'):
+            details = {value: song for value, song, _ in resolve_song_details(ytmusic, [song['videoId'] for song in unresolved], workers, max_in_flight, cache) if song is not None}
+        for song in unresolved:
+            song.update({key: details.get(song['videoId'], {}).get(key, f'Unknown {key.capitalize()}') for key in ('title', 'author')})
+
+    song_count = outcomes['added']
+    print(f"Total number of songs added: {song_count}")
+    print(f"Total number of songs skipped: {outcomes['skipped']}")
+    print(f"Total number of songs failed: {len(outcomes['failed'])}")
+    for song in outcomes['failed']:
+        print(f"Failed: {song['title']} by {song['author']} ({song['videoId']}): {song['error']}")
+    print(f"Total number of songs in the playlist: {track_count + song_count}")
+
+    if delete_duplicates:
+        delete_duplicate_song(ytmusic, playlist_id, auto_delete=True, snapshot=snapshot, batch_size=batch_size)
+    if song_count or delete_duplicates:
+        save_playlist_snapshot(ytmusic, snapshot)
+
+def similar_song_titles(title1: str, title2: str) -> bool:
+    """
+    Check if two song titles are similar.
+
+    Args:
+        title1 (str): First song title.
+        title2 (str): Second song title.
+
+    Returns:
+        bool: True if the titles are similar, False otherwise.
+    """
+    title1 = title1.lower().strip()
+    title2 = title2.lower().strip()
+    if title1 == title2:
+        return True
+    return similarity_score(difflib.SequenceMatcher(None, title1, title2)) >= SIMILARITY_THRESHOLD
+
+def similarity_score(matcher: difflib.SequenceMatcher, threshold: float = SIMILARITY_THRESHOLD) -> float:
+    """
+    Compute the similarity ratio of two sequences, skipping the expensive comparison when it cannot reach a threshold.
+
+    Args:
+        matcher (difflib.SequenceMatcher): Matcher holding the two sequences.
+        threshold (float, optional): Minimum ratio of interest. Defaults to SIMILARITY_THRESHOLD.
+
+    Returns:
+        float: The ratio, or 0.0 if it is below the threshold.
+    """
+    # real_quick_ratio and quick_ratio are cheap upper bounds of ratio.
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio >= threshold else 0.0
+
+def get_artist_name(track: Track) -> str:
+    """
+    Get the name of the first artist of a playlist track.
+
+    Args:
+        track (Track): Playlist track.
+
+    Returns:
+        str: Name of the first artist, or 'Unknown Artist' if the track has no artist.
+    """
+    return track.artist or 'Unknown Artist'
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a song title for duplicate detection.
+
+    Removes tags that do not change the song (such as "(Remastered 2011)",
+    "[Official Video]" or "feat. ..."), punctuation and extra whitespace.
+
+    Args:
+        title (str): Song title.
+
+    Returns:
+        str: Normalized title.
+    """
+    title = unicodedata.normalize('NFKC', title or '').casefold()
+    title = TITLE_TAG_PATTERN.sub(' ', title)
+    title = TITLE_SUFFIX_PATTERN.sub('', title)
+    title = FEATURING_PATTERN.sub('', title)
+    title = PUNCTUATION_PATTERN.sub(' ', title.replace("'", '').replace('\u2019', ''))
+    return ' '.join(title.split())
+
+def normalize_artist(track: Track) -> str:
+    """
+    Normalize the main artist of a playlist track for duplicate detection.
+
+    Args:
+        track (Track): Playlist track.
+
+    Returns:
+        str: Normalized name of the first artist, or an empty string if the track has no artist.
+    """
+    return normalize_name(track.artist)
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize an artist or album name: featured artists, punctuation and extra whitespace are removed.
+
+    Args:
+        name (str): Name to normalize.
+
+    Returns:
+        str: Normalized name.
+    """
+    name = FEATURING_PATTERN.sub('', unicodedata.normalize('NFKC', name or '').casefold())
+    return ' '.join(PUNCTUATION_PATTERN.sub(' ', name).split())
+
+def search_match_key(title: str, artist: str) -> str:
+    """
+    Build the key under which the search match of a song is remembered.
+
+    Args:
+        title (str): Title of the song.
+        artist (str): Artist of the song.
+
+    Returns:
+        str: Normalized title and artist, so rows that only differ in tags, case or punctuation share a match.
+    """
+    return f"{normalize_title(title)}\x1f{normalize_name(artist)}"
+
+def minhash_signature(text: str, masks: list) -> list:
+    """
+    Compute the MinHash signature of the character trigrams of a text.
+
+    Args:
+        text (str): Text to compute the signature of.
+        masks (list): One random 64-bit mask per hash function.
+
+    Returns:
+        list: The minimum hash value for each mask.
+    """
+    padded = f" {text} "
+    # The built-in hash() of strings changes between processes, so a stable hash keeps the
+    # clusters of a --plan and of the --apply that follows it identical.
+    hashes = {int.from_bytes(hashlib.blake2b(padded[i:i + 3].encode('utf-8'), digest_size=8).digest(), 'little')
+              for i in range(max(len(padded) - 2, 1))}
+    return [min(value ^ mask for value in hashes) for mask in masks]
+
+def title_numbers(title: str) -> tuple:
+    """
+    Get the numbers in a normalized song title.
+
+    Args:
+        title (str): Normalized song title.
+
+    Returns:
+        tuple: The numbers of the title in order, without leading zeros.
+    """
+    return tuple(int(number) for number in NUMBER_PATTERN.findall(title))
+
+def find_duplicate_clusters(tracks: list) -> list:
+    """
+    Find clusters of duplicate/similar songs in a list of playlist tracks.
+
+    Tracks with the same normalized title and artist are grouped directly.
+    Near-duplicate titles are found with MinHash locality-sensitive hashing on
+    the title trigrams, so only candidate pairs that share a bucket are
+    compared with similar_song_titles instead of every pair of tracks.
+
+    Each cluster is led by its first track in playlist order, and a track only
+    joins a cluster if it is similar to that canonical track, so chains of
+    similar titles ("Chapter 1", "Chapter 2", ...) are never merged through
+    each other. Titles with different numbers are never duplicates.
+
+    Args:
+        tracks (list): Track records of the playlist.
+
+    Returns:
+        list: Lists of tracks that are duplicates of each other, in playlist order. Clusters are
+            ordered by the position of their first track.
+    """
+    keys = {}
+    for index, track in enumerate(tracks):
+        keys.setdefault((normalize_title(track.title), normalize_artist(track)), []).append(index)
+
+    rows = MINHASH_ROWS_PER_BAND
+    masks = [random.Random(seed).getrandbits(64) for seed in range(MINHASH_BANDS * rows)]
+    # Buckets only hold canonical keys, the first key of each cluster.
+    buckets = {}
+    clusters = {}
+    for key in keys:
+        title, artist = key
+        signature = minhash_signature(title, masks)
+        bands = [(band,) + tuple(signature[band * rows:(band + 1) * rows]) for band in range(MINHASH_BANDS)]
+        candidates = sorted({canonical for band in bands for canonical in buckets.get(band, [])}, key=lambda canonical: keys[canonical][0])
+        for canonical in candidates:
+            canonical_title, canonical_artist = canonical
+            if (title_numbers(title) == title_numbers(canonical_title) and similar_song_titles(title, canonical_title)
+                    and similar_song_titles(artist, canonical_artist)):
+                clusters[canonical].extend(keys[key])
+                break
+        else:
+            clusters[key] = list(keys[key])
+            for band in bands:
+                buckets.setdefault(band, []).append(key)
+    return [[tracks[index] for index in sorted(indices)] for indices in clusters.values() if len(indices) > 1]
+
+def delete_duplicate_song(ytmusic: YTMusic, playlist_id: str, auto_delete: bool = False, snapshot: PlaylistSnapshot = None, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+    """
+    Delete duplicate/similar songs from a playlist.
+
+    The first track of each cluster of duplicates is kept and all other tracks
+    of the cluster are removed in chunked bulk requests.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        playlist_id (str): ID of the playlist to check for duplicates.
+        auto_delete (bool, optional): Whether to automatically delete duplicate songs. Defaults to False.
+        snapshot (PlaylistSnapshot, optional): Snapshot of the playlist to check instead of fetching it again.
+            Updated when songs are removed. Defaults to None, which also saves the updated snapshot.
+        batch_size (int, optional): Number of songs to remove per request. Defaults to DEFAULT_BATCH_SIZE.
+    """
+    report = get_run_report(ytmusic)
+    with report.phase('duplicate_cleanup'):
+        try:
+            owned_snapshot = snapshot is None
+            if snapshot is None or snapshot.stale:
+                fresh_snapshot = get_playlist_snapshot(ytmusic, playlist_id)
+                if snapshot is None:
+                    snapshot = fresh_snapshot
+                else:
+                    snapshot.set_tracks(fresh_snapshot.tracks)
+                    snapshot.stale = False
+
+            print(f"Checking for duplicate songs in playlist: {snapshot.title}...")
+
+            to_remove = []
+            for cluster in find_duplicate_clusters(snapshot.tracks):
+                canonical, duplicates = cluster[0], [song for song in cluster[1:] if song.set_video_id]
+                if not duplicates:
+                    continue
+                if not (auto_delete and report.quiet):
+                    print(f"Similar songs found: '{canonical.title}' - '{get_artist_name(canonical)}' and "
+                          + ", ".join(f"'{song.title}' - '{get_artist_name(song)}'" for song in duplicates))
+                if auto_delete:
+                    to_remove.extend(duplicates)
+                else:
+                    delete = input(f"Do you want to delete the {len(duplicates)} similar song(s) and keep '{canonical.title}'? (yes/no): ")
+                    if delete.strip().lower() in ["yes", "y"]:
+                        to_remove.extend(duplicates)
+                    else:
+                        print("Operation canceled.")
+
+            if to_remove:
+                removed = remove_playlist_items_batch(ytmusic, playlist_id, [{'videoId': song.video_id, 'setVideoId': song.set_video_id} for song in to_remove], batch_size)
+                for song in to_remove:
+                    if song.set_video_id in removed:
+                        report.song('removed', f"Song: '{song.title}' - '{get_artist_name(song)}' has been deleted from the playlist.")
+                report.end_progress()
+                snapshot.set_tracks([song for song in snapshot.tracks if song.set_video_id is None or song.set_video_id not in removed])
+                print(f"Total number of duplicate songs deleted: {len(removed)}")
+                if owned_snapshot:
+                    save_playlist_snapshot(ytmusic, snapshot)
+            if not auto_delete:
+                print("No more duplicate songs found.")
+            print("Finished checking for duplicate songs.")
+
+        except Exception as e:
+            print(f"Error deleting duplicate songs from playlist: {e}")
+
+def check_duplicates(ytmusic: YTMusic, delete_duplicates: bool, playlist: str = None) -> None:
     """
     Check for duplicate songs in a playlist.
 
     Args:
         ytmusic (YTMusic): An authenticated instance of the YTMusic class.
         delete_duplicates (bool): Whether to delete duplicate songs from the playlist.
+        playlist (str, optional): Name or ID of the playlist. Defaults to None, which asks the user.
     """
-    playlist_name = get_existing_playlist(ytmusic, prompt="Enter the number of the playlist to check the duplicates: ")
-    playlist_id = get_playlist_id(ytmusic, playlist_name)
+    if playlist is None:
+        playlist = get_existing_playlist(ytmusic, prompt="Enter the number of the playlist to check the duplicates: ")
+    playlist_id = get_playlist_id(ytmusic, playlist)
     if delete_duplicates:
         delete_duplicate_song(ytmusic, playlist_id, auto_delete=True)
     else:
         delete_duplicate_song(ytmusic, playlist_id)
 
-def get_playlist_info(ytmusic: YTMusic, values: list, args: argparse.Namespace) -> None:
+def longest_increasing_subsequence(values: list) -> set:
+    """
+    Find a longest strictly increasing subsequence of a list in O(n log n).
+
+    Args:
+        values (list): Comparable values.
+
+    Returns:
+        set: Indices of the values on the subsequence.
+    """
+    # tails[k] is the index of the smallest value ending an increasing subsequence of length k + 1.
+    tails, tail_values = [], []
+    previous = [None] * len(values)
+    for index, value in enumerate(values):
+        length = bisect.bisect_left(tail_values, value)
+        if length == len(tails):
+            tails.append(index)
+            tail_values.append(value)
+        else:
+            tails[length] = index
+            tail_values[length] = value
+        previous[index] = tails[length - 1] if length else None
+    indices = set()
+    index = tails[-1] if tails else None
+    while index is not None:
+        indices.add(index)
+        index = previous[index]
+    return indices
+
+def plan_playlist_moves(tracks: list, order: dict) -> list:
+    """
+    Compute the fewest moves that put the tracks of a playlist in CSV order.
+
+    The tracks on a longest increasing subsequence of CSV positions are already in
+    order and stay where they are; every other track is moved once, right before
+    its successor in CSV order. Moves are planned from the last track to the first,
+    so the successor is always in its final place when a track is moved before it.
+
+    Args:
+        tracks (list): Track records in playlist order, each song once and each with a setVideoId.
+        order (dict): Position of each song ID in the CSV file.
+
+    Returns:
+        list: (setVideoId, setVideoId of the successor or None for the end of the playlist) of each move,
+            in the order to apply them.
+    """
+    staying = {tracks[index].set_video_id for index in longest_increasing_subsequence([order[track.video_id] for track in tracks])}
+    moves = []
+    successor = None
+    for track in sorted(tracks, key=lambda track: order[track.video_id], reverse=True):
+        if track.set_video_id not in staying:
+            moves.append((track.set_video_id, successor))
+        successor = track.set_video_id
+    return moves
+
+def mirror_playlist(ytmusic: YTMusic, values: Iterable[str], playlist_id: str, playlist_name: str, snapshot: PlaylistSnapshot, reorder: bool = False, delete_duplicates: bool = False, batch_size: int = DEFAULT_BATCH_SIZE, workers: int = 1, max_in_flight: int = None, cache: SongMetadataCache = None, fast: bool = False, journal: ImportJournal = None, assume_yes: bool = False) -> None:
+    """
+    Make a playlist match the CSV file: remove the songs that are not in the CSV file, add the missing songs and,
+    optionally, move songs so the playlist follows the CSV order.
+
+    The delta is computed from a single snapshot of the playlist and applied in
+    batched requests, so syncing a playlist that only changed by a few rows only
+    costs a few writes. Extra copies of a song are removed as well.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        values (Iterable[str]): Unique song IDs from the CSV file, in CSV order.
+        playlist_id (str): ID of the playlist to mirror the CSV file to.
+        playlist_name (str): Name of the playlist.
+        snapshot (PlaylistSnapshot): Snapshot of the playlist, updated with the changes.
+        reorder (bool, optional): Move songs so the playlist follows the CSV order, with the fewest moves. Defaults to False.
+        delete_duplicates (bool, optional): Whether to also delete similar songs from the playlist. Defaults to False.
+        batch_size (int, optional): Number of songs to add or remove per request. Defaults to DEFAULT_BATCH_SIZE.
+        workers (int, optional): Number of song lookups to run concurrently. Defaults to 1.
+        max_in_flight (int, optional): Maximum number of song lookups in flight. Defaults to the number of workers.
+        cache (SongMetadataCache, optional): Cache of song details. Defaults to None.
+        fast (bool, optional): Add the song IDs without looking up their details first. Defaults to False.
+        journal (ImportJournal, optional): Journal to record the outcome of each added song in. Defaults to None.
+        assume_yes (bool, optional): Do not ask for confirmation before removing songs. Defaults to False.
+    """
+    report = get_run_report(ytmusic)
+    values = list(values)
+    order = {value: position for position, value in enumerate(values)}
+    kept = set()
+    to_remove = []
+    for track in snapshot.tracks:
+        if track.video_id in order and track.video_id not in kept:
+            kept.add(track.video_id)
+        elif track.set_video_id:
+            to_remove.append(track)
+    to_add = [value for value in values if value not in kept]
+
+    print(f"Mirroring the CSV file to playlist: {playlist_name}...")
+    print(f"Songs to add: {len(to_add)}, songs to remove: {len(to_remove)}")
+    if to_remove and not assume_yes:
+        confirmation = input(f"Are you sure you want to remove {len(to_remove)} songs that are not in the CSV file from the playlist? (yes/no): ").strip().lower()
+        if confirmation not in ["yes", "y"]:
+            print("Operation canceled.")
+            return
+
+    removed = set()
+    if to_remove:
+        with report.phase('writes'):
+            removed = remove_playlist_items_batch(ytmusic, playlist_id, [{'videoId': track.video_id, 'setVideoId': track.set_video_id, 'title': track.title} for track in to_remove], batch_size)
+        for track in to_remove:
+            if track.set_video_id in removed:
+                report.song('removed', f"Song: '{track.title}' - '{get_artist_name(track)}' has been removed from the playlist.")
+        report.end_progress()
+        snapshot.set_tracks([track for track in snapshot.tracks if track.set_video_id is None or track.set_video_id not in removed])
+        print(f"Total number of songs removed: {len(removed)}")
+
+    process_values(ytmusic, to_add, playlist_id, playlist_name, delete_duplicates, snapshot, batch_size, workers, max_in_flight, cache, fast, journal)
+
+    moves = []
+    if reorder:
+        if snapshot.stale:
+            snapshot.set_tracks(get_playlist_snapshot(ytmusic, playlist_id).tracks)
+            snapshot.stale = False
+        tracks, placed = [], set()
+        for track in snapshot.tracks:
+            if track.video_id in order and track.video_id not in placed and track.set_video_id:
+                placed.add(track.video_id)
+                tracks.append(track)
+        moves = plan_playlist_moves(tracks, order)
+        print(f"Songs to move: {len(moves)}")
+        by_set_video_id = {track.set_video_id: track for track in tracks}
+        moved = 0
+        for set_video_id, successor in moves:
+            track = by_set_video_id[set_video_id]
+            try:
+                with report.phase('writes'):
+                    status = ytmusic.edit_playlist(playlist_id, moveItem=(set_video_id, successor) if successor else set_video_id)
+                if 'SUCCEEDED' not in str(status):
+                    raise Exception(f"unexpected response status '{status}'")
+                report.song('moved', f"Song: '{track.title}' - '{get_artist_name(track)}' has been moved.")
+                moved += 1
+            except Exception as e:
+                report.song('failed', f"Error moving song {track.title or track.video_id}: {e}")
+        report.end_progress()
+        print(f"Total number of songs moved: {moved}")
+        if moved < len(moves) or len(tracks) != len(snapshot.tracks):
+            # The order of the tracks that were not moved as planned is unknown.
+            snapshot.stale = True
+        else:
+            snapshot.set_tracks(sorted(tracks, key=lambda track: order[track.video_id]))
+
+    if removed or moves:
+        save_playlist_snapshot(ytmusic, snapshot)
+
+def build_plan(ytmusic: YTMusic, values: Iterable[str], playlist_id: str, delete_duplicates: bool = False, mirror: bool = False) -> dict:
+    """
+    Compare the songs of a CSV file with a single snapshot of the target playlist and compute what has to change.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        values (Iterable[str]): Song IDs from the CSV file.
+        playlist_id (str): ID of the target playlist, 'LM' for Liked Songs.
+        delete_duplicates (bool, optional): Whether to plan the removal of duplicate songs. Defaults to False.
+        mirror (bool, optional): Whether to plan the removal of the songs that are not in the CSV file and of
+            extra copies of a song, see mirror_playlist. Ignored for Liked Songs. Defaults to False.
+
+    Returns:
+        dict: The plan, with the 'add', 'skip' and 'remove' sets of the target playlist.
+    """
+    snapshot = get_playlist_snapshot(ytmusic, playlist_id)
+    values = list(values)
+    present = snapshot.song_ids
+    remove = []
+    if delete_duplicates and playlist_id != 'LM':
+        for cluster in find_duplicate_clusters(snapshot.tracks):
+            remove.extend({'videoId': song.video_id, 'setVideoId': song.set_video_id, 'title': song.title}
+                          for song in cluster[1:] if song.set_video_id)
+    if mirror and playlist_id != 'LM':
+        csv_song_ids = set(values)
+        planned = {item['setVideoId'] for item in remove}
+        kept = set()
+        for song in snapshot.tracks:
+            if song.video_id in csv_song_ids and song.video_id not in kept:
+                kept.add(song.video_id)
+            elif song.set_video_id and song.set_video_id not in planned:
+                remove.append({'videoId': song.video_id, 'setVideoId': song.set_video_id, 'title': song.title})
+    return {
+        'playlist_id': playlist_id,
+        'playlist_name': snapshot.title,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'track_count': snapshot.track_count,
+        'add': [value for value in values if value not in present],
+        'skip': [value for value in values if value in present],
+        'remove': remove,
+    }
+
+def write_plan(plan: dict, path: str) -> None:
+    """
+    Write a plan to a JSON file, or to a CSV file if the path ends with '.csv'.
+
+    Args:
+        plan (dict): Plan to write, see build_plan.
+        path (str): Path of the plan file.
+    """
+    with open(path, 'w', newline='', encoding='utf-8') as plan_file:
+        if not path.lower().endswith('.csv'):
+            json.dump(plan, plan_file, indent=2, ensure_ascii=False)
+            return
+        writer = csv.writer(plan_file)
+        writer.writerow(['action', 'playlist_id', 'playlist_name', 'videoId', 'setVideoId'])
+        for action in ('add', 'skip'):
+            for value in plan[action]:
+                writer.writerow([action, plan['playlist_id'], plan['playlist_name'], value, ''])
+        for item in plan['remove']:
+            writer.writerow(['remove', plan['playlist_id'], plan['playlist_name'], item['videoId'], item['setVideoId']])
+
+def read_plan(path: str) -> dict:
+    """
+    Read a plan written by write_plan.
+
+    Args:
+        path (str): Path of the plan file.
+
+    Returns:
+        dict: The plan.
+
+    Raises:
+        ValueError: If the file is not a valid plan.
+    """
+    try:
+        with open(path, newline='', encoding='utf-8') as plan_file:
+            if not path.lower().endswith('.csv'):
+                plan = json.load(plan_file)
+            else:
+                plan = {'add': [], 'skip': [], 'remove': []}
+                for row in csv.DictReader(plan_file):
+                    plan['playlist_id'], plan['playlist_name'] = row['playlist_id'], row['playlist_name']
+                    if row['action'] == 'remove':
+                        plan['remove'].append({'videoId': row['videoId'], 'setVideoId': row['setVideoId']})
+                    else:
+                        plan[row['action']].append(row['videoId'])
+    except FileNotFoundError:
+        raise FileNotFoundError("The plan file does not exist.")
+    except (KeyError, ValueError, csv.Error) as e:
+        raise ValueError(f"The plan file could not be read: {e}")
+    if not plan.get('playlist_id'):
+        raise ValueError("The plan file does not contain a playlist ID.")
+    return plan
+
+def print_plan(plan: dict) -> None:
+    """
+    Print a summary of a plan.
+
+    Args:
+        plan (dict): Plan to summarize.
+    """
+    print(f"Plan for playlist: {plan['playlist_name']} ({plan['playlist_id']})")
+    print(f"Songs to add: {len(plan['add'])}")
+    print(f"Songs already in the playlist: {len(plan['skip'])}")
+    print(f"Songs to remove: {len(plan['remove'])}")
+
+def apply_plan(ytmusic: YTMusic, plan: dict, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+    """
+    Execute a plan: remove the planned duplicates and add the planned songs, without any lookups.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        plan (dict): Plan to execute, see build_plan.
+        batch_size (int, optional): Number of songs to add or remove per request. Defaults to DEFAULT_BATCH_SIZE.
+    """
+    print_plan(plan)
+    report = get_run_report(ytmusic)
+    playlist_id = plan['playlist_id']
+    if plan['remove']:
+        with report.phase('duplicate_cleanup'):
+            removed = remove_playlist_items_batch(ytmusic, playlist_id, plan['remove'], batch_size)
+        print(f"Total number of songs removed: {len(removed)}")
+
+    errors = {}
+    with report.phase('writes'):
+        if playlist_id == 'LM':
+            for value in plan['add']:
+                try:
+                    ytmusic.rate_song(value, 'LIKE')
+                except Exception as e:
+                    errors[value] = str(e)
+        else:
+            for start in range(0, len(plan['add']), batch_size):
+                errors.update(add_playlist_items_batch(ytmusic, playlist_id, plan['add'][start:start + batch_size])[0])
+    for value, error in errors.items():
+        print(f"Error adding song {value}: {error}")
+    print(f"Total number of songs added: {len(plan['add']) - len(errors)}")
+    print(f"Total number of songs failed: {len(errors)}")
+
+def playlist_export_row(track: dict, playlist_id: str, playlist_name: str) -> list:
+    """
+    Build the CSV row of an exported playlist track.
+
+    Args:
+        track (dict): Track as returned by the YTMusic API.
+        playlist_id (str): ID of the playlist.
+        playlist_name (str): Name of the playlist.
+
+    Returns:
+        list: Values of the EXPORT_COLUMNS.
+    """
+    artists = ', '.join(artist['name'] for artist in track.get('artists') or [] if artist.get('name'))
+    thumbnails = track.get('thumbnails') or [{}]
+    return ['VL' + playlist_id, playlist_name, track['videoId'], track.get('title') or '', artists,
+            track.get('duration') or '', thumbnails[0].get('url', '')]
+
+def export_playlist(ytmusic: YTMusic, playlist_id: str, path: str) -> None:
+    """
+    Write the tracks of a playlist to a CSV file that can be imported again.
+
+    Tracks are written as each page of the playlist arrives, so only one page is
+    held in memory. Tracks without a videoId (unavailable songs) are skipped.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        playlist_id (str): ID of the playlist, 'LM' for Liked Songs.
+        path (str): Path of the CSV file to write.
+    """
+    playlist_name = 'Liked Songs' if playlist_id == 'LM' else get_playlist_name(ytmusic, playlist_id)
+    report = get_run_report(ytmusic)
+    exported = skipped = 0
+    with open(path, 'w', newline='', encoding='utf-8') as export_file:
+        writer = csv.writer(export_file)
+        writer.writerow(EXPORT_COLUMNS)
+        for tracks in report.timed('playlist_fetch', iter_playlist_pages(ytmusic, playlist_id)):
+            with report.phase('export'):
+                for track in tracks:
+                    if not track.get('videoId'):
+                        skipped += 1
+                        report.song('unavailable')
+                        continue
+                    writer.writerow(playlist_export_row(track, playlist_id, playlist_name))
+                    exported += 1
+                    report.song('exported')
+                export_file.flush()
+    report.end_progress()
+    print(f"Total number of songs exported from {playlist_name}: {exported}")
+    if skipped:
+        print(f"Total number of unavailable songs skipped: {skipped}")
+
+def open_journal(file_path: str, playlist_id: str, resume: bool) -> ImportJournal:
+    """
+    Open the import journal of a CSV file and playlist.
+
+    Args:
+        file_path (str): Path of the CSV file being imported.
+        playlist_id (str): ID of the playlist the songs are added to.
+        resume (bool): Whether to resume from the existing journal.
+
+    Returns:
+        ImportJournal: The opened journal.
+    """
+    journal = ImportJournal(file_path, playlist_id, resume=resume)
+    if resume:
+        done_count = sum(1 for status in journal.statuses.values() if status in ImportJournal.DONE_STATUSES)
+        print(f"Resuming import: {done_count} songs were already handled by a previous run.")
+    return journal
+
+def get_playlist_info(ytmusic: YTMusic, values: Iterable[str], args: argparse.Namespace, cache: SongMetadataCache = None, file_path: str = None) -> None:
     """
     Get playlist information and add songs.
 
     Args:
         ytmusic (YTMusic): An authenticated instance of the YTMusic class.
-        values (list): List of song IDs to add.
+        values (Iterable[str]): Song IDs to add.
         args (argparse.Namespace): Parsed command-line arguments.
+        cache (SongMetadataCache, optional): Cache of song details. Defaults to None.
+        file_path (str, optional): Path of the CSV file, used to journal the import. Defaults to None.
     """
     if args.add_to_liked:
-        add_to_liked_songs(ytmusic, values)
+        playlist_id = 'LM'
+    elif args.create is not None:
+        playlist_id = create_playlist(ytmusic, args.create, args.description or '')
+    elif args.playlist is not None:
+        playlist_id = 'LM' if args.playlist == 'LM' else get_playlist_id(ytmusic, args.playlist)
     else:
-        choice = get_playlist_choice()
+        # A plan is written before any changes, so plan mode does not offer to create a playlist.
+        choice = get_playlist_choice(allow_new=not args.plan)
         if choice == 'liked':
-            add_to_liked_songs(ytmusic, values)
+            playlist_id = 'LM'
         elif choice == 'existing':
-            playlist_id = get_existing_playlist(ytmusic)
+            playlist_id = get_existing_playlist(ytmusic, allow_new=not args.plan)
         elif choice == 'new':
             playlist_id = create_playlist(ytmusic)
         else:
             raise ValueError("Invalid playlist choice.")
 
-        playlist_name = get_playlist_name(ytmusic, playlist_id)
-        track_count = len(get_playlist_songs(ytmusic, playlist_id))
-        process_values(ytmusic, values, playlist_id, playlist_name, args.delete_duplicates, track_count)
+    if args.plan:
+        plan = build_plan(ytmusic, values, playlist_id, args.delete_duplicates, args.mirror)
+        write_plan(plan, args.plan)
+        print_plan(plan)
+        print(f"Plan written to: {args.plan}. Run with --apply {args.plan} to execute it.")
+        return
+
+    journal = open_journal(file_path, playlist_id, args.resume) if file_path else None
+    try:
+        if playlist_id == 'LM':
+            # Mirroring Liked Songs is unliking the songs that are not in the CSV file.
+            add_to_liked_songs(ytmusic, values, args.workers, args.max_in_flight, cache, journal, args.yes, args.fast, args.unlike_missing or args.mirror)
+        else:
+            if args.unlike_missing:
+                print("The --unlike-missing flag only applies to Liked Songs and is ignored.")
+            snapshot = get_playlist_snapshot(ytmusic, playlist_id)
+            playlist_name = get_playlist_name(ytmusic, playlist_id, snapshot)
+            if args.mirror:
+                mirror_playlist(ytmusic, values, playlist_id, playlist_name, snapshot, args.reorder, args.delete_duplicates, args.batch_size, args.workers, args.max_in_flight, cache, args.fast, journal, args.yes)
+            else:
+                process_values(ytmusic, values, playlist_id, playlist_name, args.delete_duplicates, snapshot, args.batch_size, args.workers, args.max_in_flight, cache, args.fast, journal)
+        if journal is not None:
+            journal.finish()
+    finally:
+        if journal is not None:
+            journal.close()
+
+def read_song_ids(file_path: str, id_column: str, stream: bool = False, report: RunReport = None) -> Iterable[str]:
+    """
+    Read the unique song IDs of a CSV file.
+
+    Args:
+        file_path (str): Path of the CSV file.
+        id_column (str): Name of the column containing song IDs.
+        stream (bool, optional): Stream the file row by row instead of loading it into memory. Defaults to False.
+        report (RunReport, optional): Report to time the 'csv_parse' and 'dedup' phases in. Defaults to a new report.
+
+    Returns:
+        Iterable[str]: Unique song IDs; a lazy generator when streaming, a list otherwise.
+    """
+    if report is None:
+        report = RunReport()
+    if stream:
+        return report.timed('dedup', unique_values(report.timed('csv_parse', stream_csv_column(file_path, id_column))))
+    with report.phase('csv_parse'):
+        df = read_csv_file(file_path, usecols=[id_column])
+    with report.phase('dedup'):
+        values = list(get_unique_song_ids(df, id_column))
+    print(f"Total number of unique songs found in CSV file: {len(values)}")
+    return values
+
+def search_song_ids(ytmusic: YTMusic, file_path: str, id_column: Optional[str], search_columns: dict, stream: bool = False, workers: int = 1, max_in_flight: int = None, cache: SongMetadataCache = None) -> Iterable[str]:
+    """
+    Read the unique song IDs of a CSV file, searching YouTube Music for the rows without a song ID.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        file_path (str): Path of the CSV file.
+        id_column (Optional[str]): Name of the column containing song IDs, or None if the file has none.
+        search_columns (dict): Name of the column of each search field, see detect_search_columns.
+        stream (bool, optional): Stream the file row by row instead of loading it into memory. Defaults to False.
+        workers (int, optional): Number of searches to run concurrently. Defaults to 1.
+        max_in_flight (int, optional): Maximum number of searches in flight at once. Defaults to the number of workers.
+        cache (SongMetadataCache, optional): Cache of search matches and song details. Defaults to None.
+
+    Returns:
+        Iterable[str]: Unique song IDs; a lazy generator when streaming, a list otherwise.
+    """
+    report = get_run_report(ytmusic)
+    rows = report.timed('csv_parse', read_song_rows(file_path, id_column, search_columns, stream))
+    values = report.timed('dedup', unique_values(resolve_song_rows(ytmusic, rows, workers, max_in_flight, cache)))
+    if stream:
+        return values
+    values = list(values)
+    print(f"Total number of unique songs found in CSV file: {len(values)}")
+    return values
+
+def load_manifest(path: str) -> list:
+    """
+    Load the jobs of a batch manifest.
+
+    The manifest is a JSON (or YAML, if PyYAML is installed) list of jobs, or an
+    object with a 'jobs' list. Each job needs a 'csv' path and either a 'playlist'
+    (name or ID) or 'mode': 'liked'. The 'id_column' is detected if it is not set;
+    files without one, or jobs with 'search': true, are resolved by searching the
+    title and artist columns.
+
+    Args:
+        path (str): Path of the manifest file.
+
+    Returns:
+        list: Jobs of the manifest.
+
+    Raises:
+        ValueError: If the manifest cannot be read or a job is invalid.
+    """
+    try:
+        with open(path, encoding='utf-8') as manifest_file:
+            if path.lower().endswith(('.yml', '.yaml')):
+                try:
+                    import yaml
+                except ImportError:
+                    raise ValueError("PyYAML is required to read YAML manifests. Install it with 'pip install pyyaml' or use JSON.")
+                manifest = yaml.safe_load(manifest_file)
+            else:
+                manifest = json.load(manifest_file)
+    except FileNotFoundError:
+        raise FileNotFoundError("The manifest file does not exist.")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"The manifest file could not be parsed: {e}")
+    jobs = manifest.get('jobs') if isinstance(manifest, dict) else manifest
+    if not isinstance(jobs, list) or not jobs:
+        raise ValueError("The manifest does not contain any jobs.")
+    for number, job in enumerate(jobs, start=1):
+        if not isinstance(job, dict) or not job.get('csv'):
+            raise ValueError(f"Job {number} of the manifest needs a 'csv'.")
+        job.setdefault('mode', 'add')
+        if job['mode'] not in MANIFEST_MODES:
+            raise ValueError(f"Job {number} of the manifest has an invalid mode '{job['mode']}'. Valid modes: {', '.join(MANIFEST_MODES)}.")
+        if job['mode'] != 'liked' and not job.get('playlist'):
+            raise ValueError(f"Job {number} of the manifest needs a 'playlist'.")
+        if job['mode'] == 'plan' and not job.get('plan'):
+            raise ValueError(f"Job {number} of the manifest needs a 'plan' file in plan mode.")
+        if job['mode'] == 'plan' and job.get('create'):
+            raise ValueError(f"Job {number} of the manifest cannot set 'create' in plan mode.")
+    return jobs
+
+def resolve_job_playlist(ytmusic: YTMusic, job: dict) -> str:
+    """
+    Get the ID of the target playlist of a manifest job, creating the playlist if the job asks for it.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        job (dict): Job of the manifest, see load_manifest.
+
+    Returns:
+        str: ID of the target playlist, 'LM' for Liked Songs.
+
+    Raises:
+        ValueError: If the playlist does not exist and the job does not ask to create it.
+    """
+    if job['mode'] == 'liked':
+        return 'LM'
+    catalog = get_playlist_catalog(ytmusic)
+    playlist = catalog.get(job['playlist'])
+    if playlist is not None:
+        return playlist['playlistId']
+    if not job.get('create'):
+        raise ValueError(f"The playlist '{job['playlist']}' does not exist. Set 'create' to create it.")
+    playlist_id = ytmusic.create_playlist(job['playlist'], description=job.get('description', ''))
+    catalog.invalidate()
+    print(f"New playlist '{job['playlist']}' created.")
+    return playlist_id
+
+def run_job(ytmusic: YTMusic, job: dict, playlist_id: str, args: argparse.Namespace, cache: SongMetadataCache = None) -> None:
+    """
+    Run a single job of a batch manifest.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class, shared by all jobs.
+        job (dict): Job to run, see load_manifest.
+        playlist_id (str): ID of the target playlist, 'LM' for Liked Songs.
+        args (argparse.Namespace): Parsed command-line arguments, used for the options a job does not set.
+        cache (SongMetadataCache, optional): Cache of song details. Defaults to None.
+    """
+    file_path = job['csv']
+    validate_file_path(file_path)
+    stream = job.get('stream', args.stream)
+    columns = read_csv_header(file_path)
+    id_column = job.get('id_column') or detect_id_column(file_path, columns, stream)
+    search_columns = detect_search_columns(columns)
+    if id_column is None and not (search_columns and (job.get('search', args.search) or args.yes)):
+        raise ValueError(f"The column containing song IDs could not be detected in {file_path}. Set 'id_column', or set 'search' to search the songs by title.")
+    if id_column is not None and id_column not in columns:
+        raise ValueError(f"The column '{id_column}' does not exist in {file_path}.")
+    if id_column is None or (job.get('search', args.search) and search_columns):
+        values = search_song_ids(ytmusic, file_path, id_column, search_columns, stream, args.workers, args.max_in_flight, cache)
+    else:
+        values = read_song_ids(file_path, id_column, stream, get_run_report(ytmusic))
+    fast = job.get('fast', args.fast)
+    delete_duplicates = job.get('delete_duplicates', args.delete_duplicates)
+
+    if job['mode'] == 'plan':
+        plan = build_plan(ytmusic, values, playlist_id, delete_duplicates, job.get('mirror', args.mirror))
+        write_plan(plan, job['plan'])
+        print_plan(plan)
+        print(f"Plan written to: {job['plan']}.")
+        return
+
+    journal = open_journal(file_path, playlist_id, args.resume)
+    try:
+        if playlist_id == 'LM':
+            add_to_liked_songs(ytmusic, values, args.workers, args.max_in_flight, cache, journal, True, fast, job.get('unlike_missing', args.unlike_missing))
+        else:
+            snapshot = get_playlist_snapshot(ytmusic, playlist_id)
+            if job['mode'] == 'mirror':
+                mirror_playlist(ytmusic, values, playlist_id, snapshot.title, snapshot, job.get('reorder', args.reorder), delete_duplicates, args.batch_size, args.workers, args.max_in_flight, cache, fast, journal, True)
+            else:
+                process_values(ytmusic, values, playlist_id, snapshot.title, delete_duplicates, snapshot, args.batch_size, args.workers, args.max_in_flight, cache, fast, journal)
+        journal.finish()
+    finally:
+        journal.close()
+
+def run_manifest(ytmusic: YTMusic, path: str, args: argparse.Namespace, cache: SongMetadataCache = None) -> None:
+    """
+    Run all jobs of a batch manifest with one YTMusic session and one library playlist listing.
+
+    Jobs targeting different playlists run concurrently (--jobs) and share the
+    rate limiter and retry budget of the session. Jobs targeting the same
+    playlist run one after the other, in manifest order, so each one sees the
+    songs added by the previous ones.
+
+    Args:
+        ytmusic (YTMusic): An authenticated instance of the YTMusic class.
+        path (str): Path of the manifest file.
+        args (argparse.Namespace): Parsed command-line arguments.
+        cache (SongMetadataCache, optional): Cache of song details. Defaults to None.
+    """
+    jobs = load_manifest(path)
+
+    # Playlists are resolved (and created) up front, so two jobs targeting the
+    # same new playlist do not both create it.
+    runnable = []
+    failed = 0
+    for number, job in enumerate(jobs, start=1):
+        try:
+            runnable.append((number, job, resolve_job_playlist(ytmusic, job)))
+        except Exception as e:
+            print(f"Job {number} failed: {e}")
+            failed += 1
+
+    def run(item: tuple) -> bool:
+        number, job, playlist_id = item
+        print(f"Starting job {number}: {job['csv']} -> {'Liked Songs' if playlist_id == 'LM' else job['playlist']}")
+        try:
+            run_job(ytmusic, job, playlist_id, args, cache)
+        except (Exception, SystemExit) as e:
+            print(f"Job {number} failed: {e}")
+            return False
+        print(f"Finished job {number}.")
+        return True
+
+    groups = {}
+    for item in runnable:
+        groups.setdefault(item[2], []).append(item)
+
+    def run_group(items: list) -> int:
+        return sum(not run(item) for item in items)
+
+    for _, group_failed in map_bounded(run_group, groups.values(), args.jobs):
+        failed += group_failed
+    print(f"Finished {len(jobs)} jobs, {failed} failed.")
+
+def open_cache(args: argparse.Namespace) -> Optional[SongMetadataCache]:
+    """
+    Open the song metadata cache unless it is disabled.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+
+    Returns:
+        Optional[SongMetadataCache]: The cache, or None if --no-cache is set.
+    """
+    if args.no_cache:
+        return None
+    return SongMetadataCache(ttl=args.cache_ttl * 24 * 60 * 60, refresh=args.refresh_cache)
 
 def main() -> None:
     """
@@ -522,29 +3135,133 @@ def main() -> None:
         parser.add_argument('--delete-duplicates', '-dd', action='store_true', help='Delete duplicate songs from the playlist.')
         parser.add_argument('--check-duplicates', '-cd', action='store_true', help='Check for duplicate songs in a playlist.')
         parser.add_argument('--add-to-liked', '-al', action='store_true', help='Add songs to Liked Songs instead of a playlist.')
+        parser.add_argument('--yes', '-y', action='store_true', help='Do not ask for confirmation; with --check-duplicates, delete the duplicates that are found.')
+        parser.add_argument('--id-column', type=str, help='Name of the CSV column that contains the song IDs (default: detected from the values, or asked).')
+        parser.add_argument('--search', action='store_true', help='Search YouTube Music by title and artist for the rows without a song ID. Files without a song ID column are always searched.')
+        parser.add_argument('--title-column', type=str, help='Name of the CSV column that contains the song titles to search for (default: detected from the column names).')
+        parser.add_argument('--artist-column', type=str, help='Name of the CSV column that contains the artists to search for (default: detected from the column names).')
+        parser.add_argument('--album-column', type=str, help='Name of the CSV column that contains the albums used to rank search results (default: detected from the column names).')
+        parser.add_argument('--isrc-column', type=str, help='Name of the CSV column that contains ISRC codes to search for first (default: detected from the column names).')
+        parser.add_argument('--playlist', '-p', type=str, help='Name or ID of the existing playlist to add the songs to or to check for duplicates.')
+        parser.add_argument('--create', type=str, metavar='NAME', help='Create a new playlist with this name and add the songs to it.')
+        parser.add_argument('--description', type=str, help='Description of the playlist created with --create.')
+        parser.add_argument('--unlike-missing', action='store_true', help='When adding to Liked Songs, also unlike the songs that are not in the CSV file.')
+        parser.add_argument('--mirror', action='store_true', help='Make the playlist match the CSV file: also remove the songs that are not in the CSV file. With --add-to-liked, same as --unlike-missing.')
+        parser.add_argument('--reorder', action='store_true', help='With --mirror, also move songs so the playlist follows the CSV order, with the fewest moves.')
+        parser.add_argument('--stream', action='store_true', help='Stream the CSV file row by row instead of loading it into memory; songs are added while the file is being read.')
+        parser.add_argument('--batch-size', '-bs', type=int, default=DEFAULT_BATCH_SIZE, help=f'Number of songs to add to the playlist per request (default: {DEFAULT_BATCH_SIZE}).')
+        parser.add_argument('--workers', '-w', type=int, default=1, help='Number of song lookups and likes to run concurrently (default: 1).')
+        parser.add_argument('--max-in-flight', type=int, help='Maximum number of song lookups in flight at once (default: same as --workers).')
+        parser.add_argument('--fast', action='store_true', help='Add song IDs without looking up song details first; details are only looked up for songs that failed.')
+        parser.add_argument('--rate-limit', type=float, default=DEFAULT_RATE_LIMIT, help=f'Maximum number of YouTube Music requests per second (default: {DEFAULT_RATE_LIMIT:g}). The rate is lowered automatically when requests are throttled.')
+        parser.add_argument('--max-retries', type=int, default=DEFAULT_MAX_RETRIES, help=f'Maximum number of retries of a request that failed with a transient error (default: {DEFAULT_MAX_RETRIES}).')
+        parser.add_argument('--retry-budget', type=int, default=DEFAULT_RETRY_BUDGET, help=f'Maximum number of retries over the whole run (default: {DEFAULT_RETRY_BUDGET}).')
+        parser.add_argument('--plan', type=str, metavar='PLAN_FILE', help='Compare the CSV file with the playlist and write the songs to add, skip and remove to a JSON (or .csv) plan file instead of changing the playlist.')
+        parser.add_argument('--apply', type=str, metavar='PLAN_FILE', help='Execute a plan file written by --plan.')
+        parser.add_argument('--export', type=str, nargs=2, metavar=('PLAYLIST', 'CSV_FILE'), help="Write the songs of a playlist (name or ID, 'LM' for Liked Songs) to a CSV file that can be imported again.")
+        parser.add_argument('--manifest', type=str, metavar='MANIFEST_FILE', help='Run the CSV imports listed in a JSON or YAML manifest file with a single session.')
+        parser.add_argument('--jobs', '-j', type=int, default=1, help='Number of manifest jobs to run concurrently (default: 1).')
+        parser.add_argument('--resume', action='store_true', help='Resume an interrupted import of the same CSV file into the same playlist.')
+        parser.add_argument('--no-cache', action='store_true', help='Do not use the local song metadata cache or the saved listing of your library playlists.')
+        parser.add_argument('--snapshot-cache', action='store_true', help='Keep playlist snapshots between runs and only download a playlist again when its track count or first tracks have changed. Other changes to the playlist are not noticed, so only use it for playlists that are only changed by this script.')
+        parser.add_argument('--refresh-cache', action='store_true', help='Ignore cached song metadata and saved playlist snapshots and refresh them with new lookups.')
+        parser.add_argument('--report', type=str, metavar='REPORT_FILE', help='Write the phase timings, song outcomes and per-endpoint request counters and latencies of the run to a JSON file.')
+        parser.add_argument('--quiet', '-q', action='store_true', help='Replace the per-song output with a progress line.')
+        parser.add_argument('--cache-ttl', type=float, default=DEFAULT_CACHE_TTL / (24 * 60 * 60), help='Number of days cached song metadata stays valid (default: %(default)g).')
         args = parser.parse_args()
-
-        ytmusic = authenticate_ytmusic()
-
-        if args.check_duplicates:
+        if args.batch_size < 1:
+            parser.error("--batch-size must be at least 1.")
+        if args.workers < 1:
+            parser.error("--workers must be at least 1.")
+        if args.max_in_flight is not None and args.max_in_flight < 1:
+            parser.error("--max-in-flight must be at least 1.")
+        if args.jobs < 1:
+            parser.error("--jobs must be at least 1.")
+        if args.rate_limit <= 0:
+            parser.error("--rate-limit must be greater than 0.")
+        if args.max_retries < 0 or args.retry_budget < 0:
+            parser.error("--max-retries and --retry-budget cannot be negative.")
+        if args.no_cache and args.refresh_cache:
+            parser.error("--no-cache and --refresh-cache cannot be used together.")
+        if args.no_cache and args.snapshot_cache:
+            parser.error("--no-cache and --snapshot-cache cannot be used together.")
+        if sum([args.add_to_liked, args.playlist is not None, args.create is not None]) > 1:
+            parser.error("Only one of --add-to-liked, --playlist and --create can be used.")
+        if args.description is not None and args.create is None:
+            parser.error("--description can only be used with --create.")
+        if args.reorder and not args.mirror:
+            parser.error("--reorder can only be used with --mirror.")
+        if args.plan and args.create is not None:
+            parser.error("--plan cannot be used with --create, because a plan does not change the library.")
+
+        ytmusic = RateLimitedYTMusic(authenticate_ytmusic(), AdaptiveRateLimiter(args.rate_limit), args.max_retries, args.retry_budget)
+        ytmusic.playlist_catalog = PlaylistCatalog(ytmusic, None if args.no_cache else PLAYLIST_CATALOG_FILE)
+        ytmusic.snapshot_store = PlaylistSnapshotStore(refresh=args.refresh_cache) if args.snapshot_cache else None
+        ytmusic.run_report = RunReport(quiet=args.quiet)
+
+        if args.manifest:
+            if args.csv or args.check_duplicates or args.apply or args.plan or args.playlist or args.create or args.export:
+                print("Cannot run a manifest together with the --csv, --check-duplicates, --apply, --plan, --playlist, --create or --export flags.")
+                exit()
+            cache = open_cache(args)
+            try:
+                run_manifest(ytmusic, args.manifest, args, cache)
+            finally:
+                if cache is not None:
+                    cache.close()
+        elif args.apply:
+            if args.csv or args.check_duplicates or args.plan or args.playlist or args.create or args.export:
+                print("Cannot apply a plan together with the --csv, --check-duplicates, --plan, --playlist, --create or --export flags.")
+                exit()
+            apply_plan(ytmusic, read_plan(args.apply), args.batch_size)
+        elif args.export:
+            if args.csv or args.check_duplicates or args.plan or args.playlist or args.create or args.add_to_liked:
+                print("Cannot export a playlist together with the --csv, --check-duplicates, --plan, --playlist, --create or --add-to-liked flags.")
+                exit()
+            playlist, export_path = args.export
+            playlist_id = 'LM' if playlist == 'LM' else get_playlist_id(ytmusic, playlist)
+            export_playlist(ytmusic, playlist_id, export_path)
+            print(f"Playlist exported to: {export_path}")
+        elif args.check_duplicates:
             if args.csv:
                 print("Cannot check for duplicates when --csv flag is provided.")
                 exit()
-            if args.add_to_liked:
-                print("Cannot check for duplicates when --add-to-liked flag is provided.")
+            if args.add_to_liked or args.create:
+                print("Cannot check for duplicates when --add-to-liked or --create flag is provided.")
                 exit()
-            check_duplicates(ytmusic, args.delete_duplicates)
+            check_duplicates(ytmusic, args.delete_duplicates or args.yes, args.playlist)
         else:
             file_path = get_file_path(args)
             validate_file_path(file_path)
-            df = read_csv_file(file_path)
-            id_column = get_id_column(df)
-            values = list(get_unique_song_ids(df, id_column))
-            print(f"Total number of unique songs found in CSV file: {len(values)}")
-            get_playlist_info(ytmusic, values, args)
+            overrides = {'title': args.title_column, 'artist': args.artist_column, 'album': args.album_column, 'isrc': args.isrc_column}
+            try:
+                search_columns = detect_search_columns(read_csv_header(file_path), overrides)
+            except ValueError as e:
+                print(f"Error: {e}")
+                exit()
+            if args.search and not search_columns:
+                print("Error: No title column found to search for. Use the --title-column flag to specify it.")
+                exit()
+            id_column = select_id_column(file_path, args.id_column, args.stream, args.yes, bool(search_columns), args.search)
+            cache = open_cache(args)
+            try:
+                if id_column is None or args.search:
+                    values = search_song_ids(ytmusic, file_path, id_column, search_columns, args.stream, args.workers, args.max_in_flight, cache)
+                else:
+                    values = read_song_ids(file_path, id_column, args.stream, ytmusic.run_report)
+                get_playlist_info(ytmusic, values, args, cache, file_path)
+            finally:
+                if cache is not None:
+                    cache.close()
+        ytmusic.print_summary()
+        if args.report:
+            ytmusic.run_report.write(args.report, ytmusic)
+            print(f"Run report written to: {args.report}")
 
     except KeyboardInterrupt:
         print("")
+        if ImportJournal.unfinished:
+            print("Progress has been saved. Run again with --resume to continue the import.")
         print("Exiting...")
         exit()
 
@@ -0,0 +1,194 @@
+"""
+In-memory stand-in for the YTMusic class, for benchmarks that must not hit YouTube Music.
+
+FakeYTMusic implements the endpoints add_songs_to_ytmusic_playlist.py uses and
+counts the HTTP requests each of them would issue (a full playlist fetch costs
+one request per page of 100 tracks, and a limited fetch pages like ytmusicapi). Latency, server errors and throttling can
+be injected per request; failures raise the same "Server returned HTTP <code>"
+errors as ytmusicapi, so the retry wrapper of the script treats them the same way.
+"""
+import hashlib
+import itertools
+import random
+import threading
+import time
+
+PAGE_SIZE = 100
+
+
+def video_id(number: int, prefix: str = 'v') -> str:
+    """
+    Build a deterministic 11-character videoId.
+
+    Args:
+        number (int): Number of the song.
+        prefix (str, optional): Prefix that keeps different sets of songs apart. Defaults to 'v'.
+
+    Returns:
+        str: The videoId.
+    """
+    return f"{prefix}{number:010d}"[-11:]
+
+
+def song_metadata(song_id: str) -> tuple:
+    """
+    Build a deterministic, distinct title and artist for a videoId.
+
+    Args:
+        song_id (str): ID of the song.
+
+    Returns:
+        tuple: Title and artist of the song.
+    """
+    digest = hashlib.md5(song_id.encode('utf-8')).hexdigest()
+    return f"{digest[:5]} {digest[5:9]} {digest[9:15]}", f"Artist {digest[20:26]}"
+
+
+class FakeYTMusic:
+    """
+    Fake YTMusic backend holding playlists and Liked Songs in memory.
+    """
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, throttle_rate: float = 0.0, seed: int = 0) -> None:
+        """
+        Create an empty backend.
+
+        Args:
+            latency (float, optional): Seconds each request takes. Defaults to 0.0.
+            error_rate (float, optional): Probability that a request fails with HTTP 500. Defaults to 0.0.
+            throttle_rate (float, optional): Probability that a request fails with HTTP 429. Defaults to 0.0.
+            seed (int, optional): Seed of the failure injection. Defaults to 0.
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.random = random.Random(seed)
+        self.requests = {}
+        self.playlists = {}
+        # Liked Songs by videoId, from the oldest to the newest like.
+        self.liked = {}
+        self._set_video_ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def _request(self, endpoint: str) -> None:
+        with self._lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+            roll = self.random.random()
+        if self.latency:
+            time.sleep(self.latency)
+        if roll < self.throttle_rate:
+            raise Exception("Server returned HTTP 429: Too Many Requests.")
+        if roll < self.throttle_rate + self.error_rate:
+            raise Exception("Server returned HTTP 500: Internal Server Error.")
+
+    def _track(self, song_id: str, title: str = None) -> dict:
+        song_title, artist = song_metadata(song_id)
+        with self._lock:
+            set_video_id = f"S{next(self._set_video_ids):015d}"
+        return {'videoId': song_id, 'setVideoId': set_video_id, 'title': title or song_title, 'artists': [{'name': artist}]}
+
+    def _pages(self, endpoint: str, tracks: list, limit) -> list:
+        # Like get_continuations_2025 in ytmusicapi: the first page comes with the playlist, then
+        # continuation pages are fetched while fewer than `limit` continuation tracks were received.
+        # A limit of 1 therefore still costs a continuation request for playlists over one page.
+        page_count = max((len(tracks) + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+        if limit is not None:
+            page_count = min(page_count, 1 + (max(limit, 0) + PAGE_SIZE - 1) // PAGE_SIZE)
+        for _ in range(page_count):
+            self._request(endpoint)
+        return list(tracks[:page_count * PAGE_SIZE])
+
+    @property
+    def request_count(self) -> int:
+        """
+        int: Total number of requests issued so far.
+        """
+        return sum(self.requests.values())
+
+    def add_playlist(self, playlist_id: str, title: str, song_ids: list, duplicates: dict = None) -> None:
+        """
+        Create a playlist directly in the backend, without counting requests.
+
+        Args:
+            playlist_id (str): ID of the playlist.
+            title (str): Title of the playlist.
+            song_ids (list): IDs of the songs in the playlist.
+            duplicates (dict, optional): Title variant to append as an extra track, by song ID. Defaults to None.
+        """
+        tracks = [self._track(song_id) for song_id in song_ids]
+        tracks.extend(self._track(song_id, title) for song_id, title in (duplicates or {}).items())
+        self.playlists[playlist_id] = {'title': title, 'tracks': tracks}
+
+    def like(self, song_ids: list) -> None:
+        """
+        Add songs to Liked Songs directly in the backend, without counting requests.
+
+        Args:
+            song_ids (list): IDs of the songs to like.
+        """
+        for song_id in song_ids:
+            self.liked[song_id] = self._track(song_id)
+
+    def get_song(self, videoId: str) -> dict:
+        self._request('get_song')
+        title, artist = song_metadata(videoId)
+        return {'videoDetails': {'videoId': videoId, 'title': title, 'author': artist}}
+
+    def get_playlist(self, playlistId: str, limit: int = 100) -> dict:
+        playlist = self.playlists[playlistId]
+        tracks = self._pages('get_playlist', playlist['tracks'], limit)
+        return {'id': playlistId, 'title': playlist['title'], 'trackCount': len(playlist['tracks']), 'tracks': tracks}
+
+    def get_liked_songs(self, limit: int = 100) -> dict:
+        tracks = self._pages('get_liked_songs', list(reversed(self.liked.values())), limit)
+        return {'id': 'LM', 'title': 'Liked Music', 'trackCount': len(self.liked), 'tracks': tracks}
+
+    def get_library_playlists(self, limit: int = 25) -> list:
+        self._request('get_library_playlists')
+        return [{'playlistId': playlist_id, 'title': playlist['title'], 'count': len(playlist['tracks'])}
+                for playlist_id, playlist in self.playlists.items()]
+
+    def add_playlist_items(self, playlistId: str, videoIds: list, duplicates: bool = False) -> dict:
+        self._request('add_playlist_items')
+        tracks = [self._track(song_id) for song_id in videoIds]
+        with self._lock:
+            self.playlists[playlistId]['tracks'].extend(tracks)
+        return {'status': 'STATUS_SUCCEEDED',
+                'playlistEditResults': [{'videoId': track['videoId'], 'setVideoId': track['setVideoId']} for track in tracks]}
+
+    def remove_playlist_items(self, playlistId: str, videos: list) -> str:
+        self._request('remove_playlist_items')
+        removed = {video['setVideoId'] for video in videos}
+        with self._lock:
+            playlist = self.playlists[playlistId]
+            playlist['tracks'] = [track for track in playlist['tracks'] if track['setVideoId'] not in removed]
+        return 'STATUS_SUCCEEDED'
+
+    def edit_playlist(self, playlistId: str, moveItem=None) -> str:
+        self._request('edit_playlist')
+        if moveItem is not None:
+            set_video_id, successor = (moveItem, None) if isinstance(moveItem, str) else moveItem
+            with self._lock:
+                tracks = self.playlists[playlistId]['tracks']
+                index = next(index for index, track in enumerate(tracks) if track['setVideoId'] == set_video_id)
+                track = tracks.pop(index)
+                if successor is None:
+                    tracks.append(track)
+                else:
+                    tracks.insert(next(index for index, other in enumerate(tracks) if other['setVideoId'] == successor), track)
+        return 'STATUS_SUCCEEDED'
+
+    def rate_song(self, videoId: str, rating: str = 'INDIFFERENT') -> dict:
+        self._request('rate_song')
+        track = self._track(videoId)
+        with self._lock:
+            self.liked.pop(videoId, None)
+            if rating == 'LIKE':
+                self.liked[videoId] = track
+        return {}
+
+    def create_playlist(self, title: str, description: str, privacy_status: str = 'PRIVATE') -> str:
+        self._request('create_playlist')
+        playlist_id = f"PL{len(self.playlists):09d}"
+        self.playlists[playlist_id] = {'title': title, 'tracks': []}
+        return playlist_id
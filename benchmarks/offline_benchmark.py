@@ -0,0 +1,215 @@
+"""
+Benchmark imports, Liked Songs syncs and duplicate removal against a fake YouTube Music backend.
+
+Each scenario seeds a FakeYTMusic backend, then runs the real code path of
+add_songs_to_ytmusic_playlist.py through the same retry wrapper the script uses:
+
+    import  process_values into a playlist that already has half of the songs
+    liked   add_to_liked_songs with half of the songs already liked
+    dedup   delete_duplicate_song on a playlist where 10% of the tracks are duplicates
+    mirror  mirror_playlist with reordering, for a CSV file where 0.4% of the rows changed
+
+For every scenario and size it reports the requests issued per endpoint, the
+wall time and the peak memory allocated while the scenario ran (tracemalloc
+slows the run down; use --no-memory for clean timings). With --snapshot-cache,
+the scenarios run with a playlist snapshot store in a temporary directory, so
+the cost of its change checks is counted too. Save the results with
+--output and compare a later run with --baseline to catch request count regressions.
+
+Usage:
+    python benchmarks/offline_benchmark.py [--sizes 1000,10000,100000] [--scenarios import,liked,dedup,mirror]
+        [--latency SECONDS] [--error-rate P] [--throttle-rate P] [--workers N]
+        [--snapshot-cache] [--output results.json] [--baseline results.json]
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.dirname(BENCHMARK_DIR), BENCHMARK_DIR]
+
+import add_songs_to_ytmusic_playlist as script
+from fake_ytmusic import FakeYTMusic, song_metadata, video_id
+
+PLAYLIST_ID = 'PLbenchmark'
+
+
+def setup_import(backend: FakeYTMusic, size: int) -> list:
+    backend.add_playlist(PLAYLIST_ID, 'Benchmark', [video_id(number) for number in range(size // 2)])
+    return [video_id(number) for number in range(size)]
+
+
+def run_import(ytmusic, values: list, args: argparse.Namespace) -> None:
+    snapshot = script.get_playlist_snapshot(ytmusic, PLAYLIST_ID)
+    script.process_values(ytmusic, values, PLAYLIST_ID, snapshot.title, False, snapshot, args.batch_size, args.workers, fast=args.fast)
+
+
+def setup_liked(backend: FakeYTMusic, size: int) -> list:
+    backend.like([video_id(number) for number in range(size // 2)])
+    return [video_id(number) for number in range(size)]
+
+
+def run_liked(ytmusic, values: list, args: argparse.Namespace) -> None:
+    script.add_to_liked_songs(ytmusic, values, args.workers, assume_yes=True, fast=args.fast)
+
+
+def setup_dedup(backend: FakeYTMusic, size: int) -> list:
+    duplicate_count = size // 10
+    song_ids = [video_id(number) for number in range(size - duplicate_count)]
+    duplicates = {song_id: f"{song_metadata(song_id)[0]} (Remastered)" for song_id in song_ids[::10][:duplicate_count]}
+    backend.add_playlist(PLAYLIST_ID, 'Benchmark', song_ids, duplicates)
+    return []
+
+
+def run_dedup(ytmusic, values: list, args: argparse.Namespace) -> None:
+    script.delete_duplicate_song(ytmusic, PLAYLIST_ID, auto_delete=True, batch_size=args.batch_size)
+
+
+def setup_mirror(backend: FakeYTMusic, size: int) -> list:
+    backend.add_playlist(PLAYLIST_ID, 'Benchmark', [video_id(number) for number in range(size)])
+    # 20 changed rows per 5000: removed songs, new songs and songs moved to another place.
+    changes = max(size // 250, 1)
+    values = [video_id(number) for number in range(size) if number % (size // changes) != 1]
+    for number in range(changes):
+        values.insert(number * (len(values) // changes), values.pop(len(values) - 1 - number * 3))
+    return values + [video_id(number, 'n') for number in range(changes)]
+
+
+def run_mirror(ytmusic, values: list, args: argparse.Namespace) -> None:
+    snapshot = script.get_playlist_snapshot(ytmusic, PLAYLIST_ID)
+    script.mirror_playlist(ytmusic, values, PLAYLIST_ID, snapshot.title, snapshot, True, False, args.batch_size, args.workers, fast=args.fast, assume_yes=True)
+
+
+SCENARIOS = {
+    'import': (setup_import, run_import),
+    'liked': (setup_liked, run_liked),
+    'dedup': (setup_dedup, run_dedup),
+    'mirror': (setup_mirror, run_mirror),
+}
+
+
+def run_scenario(name: str, size: int, args: argparse.Namespace) -> dict:
+    """
+    Seed a fake backend and run one scenario against it.
+
+    Args:
+        name (str): Name of the scenario.
+        size (int): Number of songs of the scenario.
+        args (argparse.Namespace): Command line arguments.
+
+    Returns:
+        dict: Requests per endpoint, total requests, retries, wall time, peak memory and phase times of the run.
+    """
+    setup, run = SCENARIOS[name]
+    backend = FakeYTMusic(args.latency, args.error_rate, args.throttle_rate, args.seed)
+    values = setup(backend, size)
+    # Throttling lowers the rate to at most 1% of --rate-limit, instead of the script's
+    # 0.2 requests per second floor, so injected throttles do not stall the benchmark.
+    limiter = script.AdaptiveRateLimiter(args.rate_limit, min_rate=args.rate_limit / 100, burst=max(args.workers, 5))
+    ytmusic = script.RateLimitedYTMusic(backend, limiter,
+                                        args.max_retries, retry_budget=size * 10, backoff_base=args.backoff, backoff_max=args.backoff * 16)
+
+    with contextlib.ExitStack() as stack:
+        if args.snapshot_cache:
+            ytmusic.snapshot_store = script.PlaylistSnapshotStore(stack.enter_context(tempfile.TemporaryDirectory()))
+        if args.memory:
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            run(ytmusic, values, args)
+        wall_time = time.perf_counter() - start
+    peak_memory = None
+    if args.memory:
+        peak_memory = tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+
+    return {
+        'scenario': name,
+        'size': size,
+        'requests': backend.request_count,
+        'requests_per_endpoint': dict(sorted(backend.requests.items())),
+        'retries': ytmusic.counters['retries'],
+        'failures': ytmusic.counters['failures'],
+        'wall_time': round(wall_time, 3),
+        'peak_memory': peak_memory,
+        'phases': script.get_run_report(ytmusic).to_dict()['phases'],
+    }
+
+
+def compare_with_baseline(results: list, path: str) -> list:
+    """
+    Find the runs that issued more requests than the same run of a saved baseline.
+
+    Args:
+        results (list): Results of this benchmark run.
+        path (str): Path of the baseline written with --output.
+
+    Returns:
+        list: One message per regression.
+    """
+    with open(path, encoding='utf-8') as baseline_file:
+        baseline = {(result['scenario'], result['size']): result for result in json.load(baseline_file)['results']}
+    regressions = []
+    for result in results:
+        previous = baseline.get((result['scenario'], result['size']))
+        if previous is not None and result['requests'] > previous['requests']:
+            regressions.append(f"{result['scenario']} ({result['size']} songs): {result['requests']} requests, "
+                               f"{previous['requests']} in the baseline")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the script against a fake YouTube Music backend.')
+    parser.add_argument('--sizes', default='1000,10000,100000', help='Comma-separated numbers of songs (default: %(default)s).')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='Comma-separated scenarios to run (default: %(default)s).')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds each fake request takes (default: %(default)s).')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Probability of an HTTP 500 per request (default: %(default)s).')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Probability of an HTTP 429 per request (default: %(default)s).')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the error and throttle injection (default: %(default)s).')
+    parser.add_argument('--rate-limit', type=float, default=1e9, help='Requests per second of the rate limiter (default: unlimited).')
+    parser.add_argument('--max-retries', type=int, default=script.DEFAULT_MAX_RETRIES, help='Maximum retries per request (default: %(default)s).')
+    parser.add_argument('--backoff', type=float, default=0.001, help='Initial retry backoff in seconds (default: %(default)s).')
+    parser.add_argument('--batch-size', type=int, default=script.DEFAULT_BATCH_SIZE, help='Songs per add/remove request (default: %(default)s).')
+    parser.add_argument('--workers', type=int, default=1, help='Concurrent lookups (default: %(default)s).')
+    parser.add_argument('--fast', action='store_true', help='Skip the song lookups, like the --fast flag of the script.')
+    parser.add_argument('--snapshot-cache', action='store_true', help='Run with a playlist snapshot store in a temporary directory.')
+    parser.add_argument('--no-memory', dest='memory', action='store_false', help='Do not trace memory, for clean timings.')
+    parser.add_argument('--output', help='Write the results to this JSON file.')
+    parser.add_argument('--baseline', help='Fail if a run issues more requests than in this JSON file written with --output.')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    scenarios = args.scenarios.split(',')
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(unknown)}")
+
+    results = []
+    print(f"{'scenario':<8} {'songs':>7} {'requests':>9} {'retries':>8} {'time (s)':>9} {'peak (MiB)':>10}  requests per endpoint")
+    for name in scenarios:
+        for size in sizes:
+            result = run_scenario(name, size, args)
+            results.append(result)
+            peak = f"{result['peak_memory'] / 2 ** 20:.1f}" if result['peak_memory'] is not None else '-'
+            endpoints = ', '.join(f"{endpoint}={count}" for endpoint, count in result['requests_per_endpoint'].items())
+            print(f"{name:<8} {size:>7} {result['requests']:>9} {result['retries']:>8} {result['wall_time']:>9.2f} {peak:>10}  {endpoints}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump({'options': vars(args), 'results': results}, output_file, indent=2)
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline)
+        for regression in regressions:
+            print(f"Request count regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Measure the startup time of each subcommand of add_songs_to_ytmusic_playlist.py.
+
+Every sample runs in a fresh interpreter that imports the script and the
+optional modules the subcommand needs before it starts talking to YouTube
+Music. The "eager" column imports pandas and tkinter up front, like the
+script used to; the "lazy" column only imports what the subcommand uses.
+
+Usage:
+    python benchmarks/startup_time.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Subcommand -> modules its code path imports lazily.
+SUBCOMMANDS = {
+    '--check-duplicates': [],
+    '--csv FILE --stream': [],
+    '--csv FILE': ['pandas'],
+    '(file dialog)': ['pandas', 'tkinter'],
+}
+EAGER_MODULES = ['pandas', 'tkinter']
+
+
+def time_imports(modules: list, runs: int) -> float:
+    """
+    Time a fresh interpreter that imports the script and the given modules.
+
+    Args:
+        modules (list): Names of the modules to import after the script.
+        runs (int): Number of samples to take.
+
+    Returns:
+        float: Median wall time in milliseconds.
+    """
+    code = "import add_songs_to_ytmusic_playlist\n" + "".join(f"import {module}\n" for module in modules)
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=REPO_DIR, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def available(module: str) -> bool:
+    """
+    Check whether a module can be imported.
+
+    Args:
+        module (str): Name of the module.
+
+    Returns:
+        bool: True if the module is installed, False otherwise.
+    """
+    return subprocess.run([sys.executable, "-c", f"import {module}"], capture_output=True).returncode == 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure the startup time of each subcommand.')
+    parser.add_argument('--runs', type=int, default=7, help='Number of samples per measurement (default: 7).')
+    args = parser.parse_args()
+
+    missing = [module for module in EAGER_MODULES if not available(module)]
+    eager_modules = [module for module in EAGER_MODULES if module not in missing]
+    if missing:
+        print(f"Not installed, left out of the measurements: {', '.join(missing)}")
+
+    print(f"{'subcommand':<22} {'eager (ms)':>10} {'lazy (ms)':>10} {'saved (ms)':>10}")
+    for subcommand, modules in SUBCOMMANDS.items():
+        eager = time_imports(eager_modules, args.runs)
+        lazy = time_imports([module for module in modules if module not in missing], args.runs)
+        print(f"{subcommand:<22} {eager:>10.0f} {lazy:>10.0f} {eager - lazy:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
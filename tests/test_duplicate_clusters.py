@@ -0,0 +1,57 @@
+"""
+Regression tests of the duplicate detection used by --delete-duplicates and --check-duplicates.
+"""
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import add_songs_to_ytmusic_playlist as script
+
+
+def tracks(titles: list, artist: str = 'Artist') -> list:
+    return [script.Track(f"id{number:09d}", f"S{number}", title, artist) for number, title in enumerate(titles)]
+
+
+def cluster_titles(titles: list, artist: str = 'Artist') -> list:
+    return [[track.title for track in cluster] for cluster in script.find_duplicate_clusters(tracks(titles, artist))]
+
+
+def test_tags_and_case_are_duplicates():
+    assert cluster_titles(['Yesterday', 'Yesterday (Remastered 2009)', 'YESTERDAY', 'Help!']) == [
+        ['Yesterday', 'Yesterday (Remastered 2009)', 'YESTERDAY']]
+
+
+def test_numbered_chapters_are_not_duplicates():
+    assert cluster_titles([f"Chapter {number}" for number in range(1, 30)], 'Narrator') == []
+
+
+def test_numbered_pieces_are_not_duplicates():
+    assert cluster_titles([f"Nocturne Op. 9 No. {number}" for number in range(1, 13)], 'Chopin') == []
+    assert cluster_titles(['Symphony No. 5', 'Symphony No. 6']) == []
+    assert cluster_titles(['Part 1', 'Part 2']) == []
+    assert cluster_titles(['Track 01', 'Track 02']) == []
+
+
+def test_leading_zeros_do_not_change_the_number():
+    assert script.title_numbers('track 01') == script.title_numbers('track 1') == (1,)
+
+
+def test_clusters_are_not_chained():
+    # Each title is similar to its neighbours, but the last ones are not similar to the first.
+    titles = ['abcdefghij', 'abcdefghik', 'abcdefghkl', 'abcdefgklm', 'abcdefklmn']
+    for cluster in script.find_duplicate_clusters(tracks(titles)):
+        canonical = cluster[0].title
+        assert all(script.similar_song_titles(canonical, track.title) for track in cluster[1:])
+
+
+def test_clusters_do_not_depend_on_the_hash_seed():
+    code = ("import sys; sys.path.insert(0, sys.argv[1]); import add_songs_to_ytmusic_playlist as script; "
+            "tracks = [script.Track(f'id{n}', f'S{n}', f'song {chr(97 + n % 26)}{chr(97 + n // 26 % 26)} title', 'a') for n in range(500)]; "
+            "print([[t.video_id for t in c] for c in script.find_duplicate_clusters(tracks)])")
+    outputs = {subprocess.run([sys.executable, '-c', code, ROOT_DIR], capture_output=True, text=True, check=True,
+                              env=dict(os.environ, PYTHONHASHSEED=str(seed))).stdout
+               for seed in range(1, 4)}
+    assert len(outputs) == 1
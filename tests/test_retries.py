@@ -0,0 +1,80 @@
+"""
+Regression tests of the retry policy of RateLimitedYTMusic.
+"""
+import os
+import socket
+import sys
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import add_songs_to_ytmusic_playlist as script
+
+
+class FlakyYTMusic:
+    """
+    YTMusic stand-in whose methods raise the given errors before succeeding.
+    """
+
+    def __init__(self, errors: list) -> None:
+        self.errors = list(errors)
+        self.calls = 0
+
+    def _call(self) -> dict:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {'status': 'STATUS_SUCCEEDED'}
+
+    def add_playlist_items(self, playlist_id: str, video_ids: list) -> dict:
+        return self._call()
+
+    def get_song(self, video_id: str) -> dict:
+        return self._call()
+
+
+def wrap(ytmusic: FlakyYTMusic) -> script.RateLimitedYTMusic:
+    return script.RateLimitedYTMusic(ytmusic, script.AdaptiveRateLimiter(max_rate=1000), backoff_base=0)
+
+
+def closed_port_error() -> requests.exceptions.ConnectionError:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    with pytest.raises(requests.exceptions.ConnectionError) as error:
+        requests.get(f"http://127.0.0.1:{port}", timeout=5)
+    return error.value
+
+
+@pytest.mark.parametrize('error', [
+    Exception("Server returned HTTP 500: Internal Server Error."),
+    requests.exceptions.ReadTimeout("Read timed out."),
+    requests.exceptions.ConnectionError("Connection reset by peer"),
+])
+def test_writes_are_not_repeated_after_ambiguous_failures(error):
+    ytmusic = FlakyYTMusic([error])
+    with pytest.raises(type(error)):
+        wrap(ytmusic).add_playlist_items('PL1', ['a'])
+    assert ytmusic.calls == 1
+
+
+@pytest.mark.parametrize('error', [
+    Exception("Server returned HTTP 429: Too Many Requests."),
+    closed_port_error(),
+])
+def test_writes_are_retried_when_they_were_not_applied(error):
+    ytmusic = FlakyYTMusic([error])
+    wrap(ytmusic).add_playlist_items('PL1', ['a'])
+    assert ytmusic.calls == 2
+
+
+@pytest.mark.parametrize('error', [
+    Exception("Server returned HTTP 500: Internal Server Error."),
+    requests.exceptions.ReadTimeout("Read timed out."),
+])
+def test_reads_are_retried_after_transient_failures(error):
+    ytmusic = FlakyYTMusic([error])
+    wrap(ytmusic).get_song('a')
+    assert ytmusic.calls == 2